@@ -613,7 +613,7 @@ class PipelineAPI:
 
         try:
             df = pd.read_csv(source_path)
-            original_columns = list(df.columns)
+            original_columns = df.columns
 
             # Build rename dictionary: user_column -> system_column
             rename_map = {}
@@ -656,8 +656,8 @@ class PipelineAPI:
                     if pd.isna(value):
                         row[key] = None
 
-            logger.info(f'Column mapping applied: {rename_map}')
-            logger.info(f'Original columns: {original_columns} -> Mapped columns: {list(df.columns)}')
+            logger.info('Column mapping applied: %s', rename_map)
+            logger.info('Original columns: %s -> Mapped columns: %s', list(original_columns), list(df.columns))
 
             return {
                 'success': True,
@@ -772,10 +772,9 @@ class PipelineAPI:
         try:
             # Check required columns
             if deps['required_columns']:
-                df = pd.read_csv(dataset_path)
-                for col in deps['required_columns']:
-                    if col not in df.columns:
-                        missing_columns.append(col)
+                # Only the header is needed to check for columns
+                df = pd.read_csv(dataset_path, nrows=0)
+                missing_columns = ConfigDataset.get_missing_columns(df, deps['required_columns'])
 
             # Check required files (resolve paths relative to dataset directory)
             dataset_dir = Path(dataset_path).parent
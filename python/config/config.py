@@ -140,10 +140,27 @@ class ConfigDataset:
     MULTILABEL_MODEL_ID = 'victorwkey/tourism-categories-bert'
     SUBJECTIVITY_MODEL_ID = 'victorwkey/tourism-subjectivity-bert'
 
+    # Dynamic INT8 quantization of the sentiment model when running on CPU (opt-in, slight accuracy trade-off)
+    SENTIMENT_QUANTIZE_CPU = os.getenv('SENTIMENT_QUANTIZE_CPU', 'false').lower() == 'true'
+
     # Local threshold files (optional, models have default thresholds)
     MULTILABEL_THRESHOLDS_PATH = MODELS_DIR / 'multilabel_task' / 'optimal_thresholds.json'
     SUBJECTIVITY_THRESHOLDS_PATH = MODELS_DIR / 'subjectivity_task' / 'optimal_thresholds.json'
 
+    # Low-cardinality label columns that the analysis phases read as pandas 'category'
+    CATEGORICAL_COLUMNS = ('Sentimiento', 'Subjetividad')
+
+    @classmethod
+    def get_categorical_dtypes(cls) -> dict[str, str]:
+        """Returns the read_csv dtype mapping that loads the label columns as 'category'."""
+        return dict.fromkeys(cls.CATEGORICAL_COLUMNS, 'category')
+
+    @staticmethod
+    def get_missing_columns(df, required) -> list[str]:
+        """Returns the required columns absent from df, in the order they were requested (empty if none)."""
+        presentes = set(df.columns)
+        return [col for col in required if col not in presentes]
+
     @classmethod
     def get_models_cache_dir(cls) -> str:
         """Returns the absolute path to the local models cache directory as a string."""
@@ -6,50 +6,60 @@ Contiene todas las fases del pipeline de análisis de opiniones turísticas.
 Heavy ML dependencies (torch, transformers, bertopic, langchain, etc.) are
 imported lazily so that lightweight modules (fase_01, rollback_manager) remain
 importable in environments that only have the minimal test dependencies.
+The heavy exports are resolved on first attribute access (PEP 562), so
+``import core`` or ``from core import ProcesadorBasico`` never pays for them.
 """
 
+import importlib
+
 # Always available — only require stdlib + pandas
 from .fase_01_procesamiento_basico import ProcesadorBasico
 from .rollback_manager import RollbackManager, get_rollback_manager
 
-# Optional heavy dependencies — silently unavailable if packages aren't installed
-try:
-    from .fase_02_estadisticas_basicas import GeneradorEstadisticasBasicas
-    from .fase_03_analisis_sentimientos import AnalizadorSentimientos
-    from .fase_04_analisis_subjetividad import AnalizadorSubjetividad
-    from .fase_05_clasificacion_categorias import ClasificadorCategorias
-    from .fase_06_analisis_jerarquico_topicos import AnalizadorJerarquicoTopicos
-    from .fase_07_resumen_inteligente import ResumidorInteligente
-    from .fase_08_insights_estrategicos import GeneradorInsightsEstrategicos
-    from .fase_08_visualizaciones import GeneradorVisualizaciones
-except ImportError:
-    pass
+# Optional heavy dependencies — name → submodule, imported on first access.
+# If the packages aren't installed, accessing the name raises ImportError.
+_EXPORTS_PEREZOSOS = {
+    'GeneradorEstadisticasBasicas': '.fase_02_estadisticas_basicas',
+    'AnalizadorSentimientos': '.fase_03_analisis_sentimientos',
+    'AnalizadorSubjetividad': '.fase_04_analisis_subjetividad',
+    'ClasificadorCategorias': '.fase_05_clasificacion_categorias',
+    'AnalizadorJerarquicoTopicos': '.fase_06_analisis_jerarquico_topicos',
+    'ResumidorInteligente': '.fase_07_resumen_inteligente',
+    'GeneradorInsightsEstrategicos': '.fase_08_insights_estrategicos',
+    'GeneradorVisualizaciones': '.fase_08_visualizaciones',
+    # LLM Provider
+    'LLMProvider': '.llm_provider',
+    'LLMRetryExhaustedError': '.llm_provider',
+    'RobustStructuredChain': '.llm_provider',
+    'crear_chain': '.llm_provider',
+    'crear_chain_robusto': '.llm_provider',
+    'get_llm': '.llm_provider',
+    # LLM Utils
+    'LLMEmptyResponseError': '.llm_utils',
+    'LLMError': '.llm_utils',
+    'LLMParsingError': '.llm_utils',
+    'RetryConfig': '.llm_utils',
+    'extraer_json_de_respuesta': '.llm_utils',
+    'parsear_json_seguro': '.llm_utils',
+    'parsear_pydantic_seguro': '.llm_utils',
+    'reparar_json': '.llm_utils',
+}
+
+
+def __getattr__(name: str):
+    modulo = _EXPORTS_PEREZOSOS.get(name)
+    if modulo is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    valor = getattr(importlib.import_module(modulo, __name__), name)
+    # Cachear en el módulo para que los siguientes accesos no pasen por __getattr__
+    globals()[name] = valor
+    return valor
+
 
-try:
-    from .llm_provider import (
-        LLMProvider,
-        LLMRetryExhaustedError,
-        RobustStructuredChain,
-        crear_chain,
-        crear_chain_robusto,
-        get_llm,
-    )
-except ImportError:
-    pass
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-try:
-    from .llm_utils import (
-        LLMEmptyResponseError,
-        LLMError,
-        LLMParsingError,
-        RetryConfig,
-        extraer_json_de_respuesta,
-        parsear_json_seguro,
-        parsear_pydantic_seguro,
-        reparar_json,
-    )
-except ImportError:
-    pass
 
 __all__ = [
     # Always available
@@ -72,13 +72,30 @@ class ProcesadorBasico:
 
         return ' '.join(texto_partes) if texto_partes else ''
 
+    @staticmethod
+    def _normalizar_parte_texto(serie: pd.Series, excluidos: list[str]) -> pd.Series:
+        """
+        Versión vectorizada del tratamiento de cada parte en crear_texto_consolidado.
+
+        Args:
+            serie: Columna de texto (Titulo o Review) sin nulos
+            excluidos: Valores (en minúsculas) que se consideran vacíos
+
+        Returns:
+            Serie con el texto limpio terminado en punto, o '' si se descarta
+        """
+        texto = serie.astype(str).str.strip()
+        descartado = texto.str.lower().isin(excluidos)
+        texto = texto.where(texto.str.endswith('.'), texto + '.')
+        return texto.mask(descartado, '')
+
     def ya_procesado(self) -> bool:
         """
         Verifica si esta fase ya fue ejecutada.
         Revisa si existe la columna 'TituloReview' en el dataset.
         """
         try:
-            df = pd.read_csv(self.dataset_path)
+            df = pd.read_csv(self.dataset_path, nrows=0)
             return 'TituloReview' in df.columns
         except Exception:
             return False
@@ -122,15 +139,21 @@ class ProcesadorBasico:
             has_titulo = 'Titulo' in self.df.columns
             has_review = 'Review' in self.df.columns
 
+            # Rellenar nulos de las columnas de texto en una sola llamada
+            columnas_texto = [col for col in ('Titulo', 'Review') if col in self.df.columns]
+            textos = self.df[columnas_texto].fillna(dict.fromkeys(columnas_texto, ''))
+
             if has_titulo and has_review:
-                # Caso 1: Ambas columnas existen, concatenar
-                self.df['TituloReview'] = self.df.apply(self.crear_texto_consolidado, axis=1)
+                # Caso 1: Ambas columnas existen, concatenar (vectorizado, misma lógica que crear_texto_consolidado)
+                titulo = self._normalizar_parte_texto(textos['Titulo'], ['sin titulo', 'nan', 'none', ''])
+                review = self._normalizar_parte_texto(textos['Review'], ['nan', 'none', ''])
+                self.df['TituloReview'] = (titulo + ' ' + review).str.strip()
             elif has_review:
                 # Caso 2: Solo Review existe (Titulo es opcional)
-                self.df['TituloReview'] = self.df['Review'].fillna('').astype(str)
+                self.df['TituloReview'] = textos['Review'].astype(str)
             elif has_titulo:
                 # Caso 3: Solo Titulo existe (edge case)
-                self.df['TituloReview'] = self.df['Titulo'].fillna('').astype(str)
+                self.df['TituloReview'] = textos['Titulo'].astype(str)
             else:
                 raise ValueError("El dataset debe contener al menos la columna 'Review'")
 
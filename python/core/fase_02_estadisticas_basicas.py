@@ -42,6 +42,7 @@ class GeneradorEstadisticasBasicas:
         self.dataset_path = ConfigDataset.get_dataset_path()
         self.output_dir = ConfigDataset.get_visualizaciones_dir()
         self.df: pd.DataFrame | None = None
+        self.fechas: pd.Series | None = None
 
     def ya_procesado(self) -> bool:
         """
@@ -80,6 +81,13 @@ class GeneradorEstadisticasBasicas:
         self.df = pd.read_csv(self.dataset_path)
         total = len(self.df)
 
+        # FechaEstadia se convierte una sola vez: la reutilizan la validación y las estadísticas
+        self.fechas = (
+            pd.to_datetime(self.df['FechaEstadia'], errors='coerce').dropna()
+            if 'FechaEstadia' in self.df.columns
+            else None
+        )
+
         # Generar todas las estadísticas básicas
         insights = {
             'fecha_generacion': datetime.now().isoformat(),
@@ -111,8 +119,8 @@ class GeneradorEstadisticasBasicas:
 
         # Calcular rango temporal si hay fechas
         rango_temporal_dias = 0
-        if tiene_fechas:
-            fechas = pd.to_datetime(self.df['FechaEstadia'], errors='coerce').dropna()
+        if tiene_fechas and self.fechas is not None:
+            fechas = self.fechas
             if len(fechas) > 0:
                 rango_temporal_dias = int((fechas.max() - fechas.min()).days)
 
@@ -179,13 +187,16 @@ class GeneradorEstadisticasBasicas:
 
         # ── Sentimiento (no disponible aún) ──
         if 'Sentimiento' in self.df.columns:
-            sent_counts = self.df['Sentimiento'].value_counts()
+            # reindex alinea las tres etiquetas (0 si falta alguna) en una sola operación
+            sent_counts = (
+                self.df['Sentimiento'].value_counts().reindex(['Positivo', 'Neutro', 'Negativo'], fill_value=0)
+            )
             stats['sentimiento'] = {
                 label: {
-                    'cantidad': int(sent_counts.get(label, 0)),
-                    'porcentaje': round(int(sent_counts.get(label, 0)) / total * 100, 1) if total else 0,
+                    'cantidad': int(cantidad),
+                    'porcentaje': round(int(cantidad) / total * 100, 1) if total else 0,
                 }
-                for label in ['Positivo', 'Neutro', 'Negativo']
+                for label, cantidad in sent_counts.items()
             }
         else:
             stats['sentimiento'] = None
@@ -195,7 +206,8 @@ class GeneradorEstadisticasBasicas:
 
         # ── Calificación (si existe en dataset original) ──
         if 'Calificacion' in self.df.columns:
-            cal_counts = self.df['Calificacion'].value_counts().sort_index()
+            # Sin ordenar por frecuencia: el resultado se ordena por calificación de todas formas
+            cal_counts = self.df['Calificacion'].value_counts(sort=False).sort_index()
             stats['calificacion'] = {
                 str(int(k)): {'cantidad': int(v), 'porcentaje': round(int(v) / total * 100, 1) if total else 0}
                 for k, v in cal_counts.items()
@@ -212,8 +224,8 @@ class GeneradorEstadisticasBasicas:
         stats['topicos'] = None
 
         # ── Temporal ──
-        if 'FechaEstadia' in self.df.columns:
-            fechas = pd.to_datetime(self.df['FechaEstadia'], errors='coerce').dropna()
+        if 'FechaEstadia' in self.df.columns and self.fechas is not None:
+            fechas = self.fechas
             if len(fechas) > 0:
                 stats['temporal'] = {
                     'fecha_min': fechas.min().strftime('%Y-%m-%d'),
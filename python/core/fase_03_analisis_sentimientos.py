@@ -6,23 +6,15 @@ Analiza sentimientos de las opiniones turísticas usando HuggingFace BERT.
 
 import logging
 import warnings
+from operator import itemgetter
 
 import pandas as pd
 from tqdm import tqdm
 
 from config.config import ConfigDataset
 
-warnings.filterwarnings('ignore')
-
 logger = logging.getLogger(__name__)
 
-try:
-    from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
-
-    TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    TRANSFORMERS_AVAILABLE = False
-
 
 class AnalizadorSentimientos:
     """
@@ -50,28 +42,69 @@ class AnalizadorSentimientos:
     # Mapeo de etiquetas a valor numérico de estrellas (polarity)
     MAPEO_ESTRELLAS = {'1 star': 1, '2 stars': 2, '3 stars': 3, '4 stars': 4, '5 stars': 5}
 
+    # Etiqueta del modelo -> (sentimiento, estrellas), resuelto con una sola búsqueda por resultado
+    MAPEO_RESULTADO = {
+        '1 star': ('Negativo', 1),
+        '2 stars': ('Negativo', 2),
+        '3 stars': ('Neutro', 3),
+        '4 stars': ('Positivo', 4),
+        '5 stars': ('Positivo', 5),
+    }
+
+    # Cortes de estrellas equivalentes a MAPEO_ETIQUETAS (1-2 Negativo, 3 Neutro, 4-5 Positivo),
+    # usados para derivar la columna 'Sentimiento' de todo el dataset en una sola pasada
+    CORTES_ESTRELLAS = [0, 2, 3, 5]
+    ETIQUETAS_CORTES = ['Negativo', 'Neutro', 'Positivo']
+
+    # Textos por lote en cada llamada al pipeline
+    BATCH_SIZE = 32
+    # Longitud máxima en tokens; el tokenizador trunca el resto
+    MAX_LENGTH = 128
+
     def __init__(self) -> None:
         """Inicializa el analizador."""
         self.DATASET_PATH = self._get_dataset_path()
         self.pipeline = None
+        self.device = None
         self.modelo_cargado = False
 
     def cargar_modelo(self) -> None:
         """Carga el modelo preentrenado de HuggingFace."""
-        if not TRANSFORMERS_AVAILABLE:
+        # torch y transformers se importan aquí para que importar el módulo no cargue el stack de ML
+        try:
+            import torch
+            from transformers import AutoModelForSequenceClassification, AutoTokenizer, pipeline
+        except ImportError as e:
             raise ImportError(
                 'La librería transformers no está disponible. Instala con: pip install transformers torch'
-            )
+            ) from e
 
         try:
+            self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
+            # En GPU se infiere en media precisión; en CPU se mantiene FP32
+            dtype = torch.float16 if self.device.type == 'cuda' else torch.float32
+
             cache_dir = ConfigDataset.get_models_cache_dir()
-            tokenizer = AutoTokenizer.from_pretrained(self.MODELO_NOMBRE, cache_dir=cache_dir)
-            model = AutoModelForSequenceClassification.from_pretrained(self.MODELO_NOMBRE, cache_dir=cache_dir)
+            # Avisos de deprecación de transformers al cargar el checkpoint
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', FutureWarning)
+                tokenizer = AutoTokenizer.from_pretrained(self.MODELO_NOMBRE, cache_dir=cache_dir)
+                model = AutoModelForSequenceClassification.from_pretrained(
+                    self.MODELO_NOMBRE, cache_dir=cache_dir, torch_dtype=dtype
+                )
+            if self.device.type == 'cpu' and ConfigDataset.SENTIMENT_QUANTIZE_CPU:
+                # Cuantización dinámica INT8 de las capas lineales
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
             self.pipeline = pipeline(
                 'sentiment-analysis',
                 model=model,
                 tokenizer=tokenizer,
-                return_all_scores=True,
+                device=self.device,
+                # Solo se usa la etiqueta más probable: el pipeline hace el argmax y devuelve un único score
+                top_k=1,
+                truncation=True,
+                max_length=self.MAX_LENGTH,
             )
             self.modelo_cargado = True
 
@@ -94,15 +127,32 @@ class AnalizadorSentimientos:
         # Estructura anidada o directa
         scores_list = resultado[0] if isinstance(resultado[0], list) else resultado
 
-        # Obtener etiqueta con mayor probabilidad
-        mejor_prediccion = max(scores_list, key=lambda x: x['score'])
-        mejor_label = mejor_prediccion['label']
+        # Obtener etiqueta con mayor probabilidad (con top_k=1 la lista ya trae solo esa)
+        mejor_label = max(scores_list, key=itemgetter('score'))['label']
 
         # Mapeo directo (modelo nlptown predice "1 star" ... "5 stars")
-        sentimiento = self.MAPEO_ETIQUETAS.get(mejor_label, 'Neutro')
-        estrellas = self.MAPEO_ESTRELLAS.get(mejor_label, 3)
+        return self.MAPEO_RESULTADO.get(mejor_label, ('Neutro', 3))
 
-        return sentimiento, estrellas
+    @classmethod
+    def estrellas_a_sentimiento(cls, estrellas) -> pd.Categorical:
+        """
+        Convierte estrellas o calificaciones (1-5) a sentimiento para toda una columna a la vez.
+
+        Equivale a MAPEO_ETIQUETAS sin recorrer los valores en Python. Valores nulos o fuera
+        de rango se consideran 'Neutro'.
+
+        Args:
+            estrellas: Lista, array o Serie de estrellas/calificaciones
+
+        Returns:
+            pd.Categorical: Sentimientos ('Negativo' < 'Neutro' < 'Positivo')
+        """
+        sentimientos = pd.cut(
+            pd.to_numeric(pd.Series(estrellas), errors='coerce').to_numpy(),
+            bins=cls.CORTES_ESTRELLAS,
+            labels=cls.ETIQUETAS_CORTES,
+        )
+        return sentimientos.fillna('Neutro')
 
     def analizar_texto(self, texto: str) -> tuple[str, int]:
         """
@@ -121,21 +171,57 @@ class AnalizadorSentimientos:
             return 'Neutro', 3
 
         try:
-            # Limitar a 512 caracteres
-            texto_procesado = str(texto)[:512]
-            resultado = self.pipeline(texto_procesado)
+            resultado = self.pipeline(str(texto))
             return self.mapear_resultado(resultado)
 
         except Exception:
             return 'Neutro', 3
 
+    def predecir_estrellas(self, textos: list) -> list[int]:
+        """
+        Predice las estrellas (1-5) de una lista de textos, enviándolos al modelo por lotes.
+
+        Los textos vacíos o nulos se resuelven como 3 estrellas (Neutro) sin pasar por el modelo, y los
+        textos repetidos se infieren una sola vez. Si el pipeline falla, los textos pendientes se analizan
+        uno a uno con analizar_texto.
+
+        Args:
+            textos: Lista de textos a analizar
+
+        Returns:
+            list: Estrellas predichas, en el mismo orden que los textos
+        """
+        if not self.modelo_cargado:
+            raise RuntimeError('Modelo no cargado')
+
+        indices_validos = [i for i, texto in enumerate(textos) if not pd.isna(texto) and str(texto).strip() != '']
+        textos_por_indice = {i: str(textos[i]) for i in indices_validos}
+
+        # Los títulos repetidos pasan una sola vez por el modelo; ordenarlos por longitud agrupa
+        # textos similares en cada lote y reduce el relleno (padding)
+        unicos = sorted(dict.fromkeys(textos_por_indice.values()), key=len)
+        estrellas_por_texto = {}
+
+        try:
+            # El pipeline consume un generador: tokeniza el siguiente lote mientras el modelo procesa el actual
+            resultados = self.pipeline((texto for texto in unicos), batch_size=self.BATCH_SIZE)
+            for texto, resultado in tqdm(zip(unicos, resultados), total=len(unicos), desc='   Progreso'):
+                estrellas_por_texto[texto] = self.mapear_resultado(resultado)[1]
+        except Exception:
+            # Continuar texto a texto con los que quedaron pendientes
+            for texto in unicos:
+                if texto not in estrellas_por_texto:
+                    estrellas_por_texto[texto] = self.analizar_texto(texto)[1]
+
+        return [estrellas_por_texto[textos_por_indice[i]] if i in textos_por_indice else 3 for i in range(len(textos))]
+
     def ya_procesado(self) -> bool:
         """
         Verifica si esta fase ya fue ejecutada.
         Revisa si existe la columna 'Sentimiento' en el dataset.
         """
         try:
-            df = pd.read_csv(self.DATASET_PATH)
+            df = pd.read_csv(self.DATASET_PATH, nrows=0)
             return 'Sentimiento' in df.columns
         except Exception:
             return False
@@ -153,23 +239,18 @@ class AnalizadorSentimientos:
             return
 
         # Cargar dataset
-        df = pd.read_csv(self.DATASET_PATH)
+        df = pd.read_csv(self.DATASET_PATH, dtype=ConfigDataset.get_categorical_dtypes())
 
         # Cargar modelo
         self.cargar_modelo()
 
-        # Procesar sentimientos
+        # Procesar sentimientos (el modelo predice estrellas; el sentimiento se deriva de ellas)
         total = len(df)
-        sentimientos = []
-        estrellas_list = []
-
-        for _, texto in enumerate(tqdm(df['TituloReview'], desc='   Progreso')):
-            sentimiento, estrellas = self.analizar_texto(texto)
-            sentimientos.append(sentimiento)
-            estrellas_list.append(estrellas)
+        estrellas_list = self.predecir_estrellas(df['TituloReview'].tolist())
 
-        # Agregar columna de sentimiento al dataset
-        df['Sentimiento'] = sentimientos
+        # Agregar columna de sentimiento al dataset (pd.cut devuelve un Categorical ordenado:
+        # códigos int8 en memoria; en el CSV se escriben las etiquetas igual que antes)
+        df['Sentimiento'] = self.estrellas_a_sentimiento(estrellas_list)
 
         # Agregar columna de calificación (polarity) si no existe en el dataset original
         if 'Calificacion' not in df.columns:
@@ -16,8 +16,6 @@ from transformers import AutoModelForSequenceClassification, AutoTokenizer
 
 from config.config import ConfigDataset
 
-warnings.filterwarnings('ignore')
-
 logger = logging.getLogger(__name__)
 
 
@@ -26,20 +24,22 @@ class SubjectivityDataset(Dataset):
 
     def __init__(self, texts, tokenizer, max_length):
         self.texts = texts
-        self.tokenizer = tokenizer
-        self.max_length = max_length
+        # Tokenizar todos los textos en una sola llamada (el tokenizador rápido procesa el lote completo)
+        self.encodings = tokenizer(
+            [str(text) for text in texts],
+            max_length=max_length,
+            padding='max_length',
+            truncation=True,
+            return_tensors='pt',
+        )
 
     def __len__(self):
         return len(self.texts)
 
     def __getitem__(self, idx):
-        encoding = self.tokenizer(
-            str(self.texts[idx]), max_length=self.max_length, padding='max_length', truncation=True, return_tensors='pt'
-        )
-
         return {
-            'input_ids': encoding['input_ids'].squeeze(0),
-            'attention_mask': encoding['attention_mask'].squeeze(0),
+            'input_ids': self.encodings['input_ids'][idx],
+            'attention_mask': self.encodings['attention_mask'][idx],
             'idx': idx,
         }
 
@@ -77,8 +77,11 @@ class AnalizadorSubjetividad:
         """Carga el modelo fine-tuned desde la caché local."""
         try:
             cache_dir = ConfigDataset.get_models_cache_dir()
-            self.tokenizer = AutoTokenizer.from_pretrained(self.MODEL_ID, cache_dir=cache_dir)
-            self.model = AutoModelForSequenceClassification.from_pretrained(self.MODEL_ID, cache_dir=cache_dir)
+            # Avisos de deprecación de transformers al cargar el checkpoint
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', FutureWarning)
+                self.tokenizer = AutoTokenizer.from_pretrained(self.MODEL_ID, cache_dir=cache_dir)
+                self.model = AutoModelForSequenceClassification.from_pretrained(self.MODEL_ID, cache_dir=cache_dir)
             self.model.to(self.device)
             self.model.eval()
             self.modelo_cargado = True
@@ -118,7 +121,7 @@ class AnalizadorSubjetividad:
         Revisa si existe la columna 'Subjetividad' en el dataset.
         """
         try:
-            df = pd.read_csv(self.DATASET_PATH)
+            df = pd.read_csv(self.DATASET_PATH, nrows=0)
             return 'Subjetividad' in df.columns
         except Exception:
             return False
@@ -136,7 +139,7 @@ class AnalizadorSubjetividad:
             return
 
         # Cargar dataset
-        df = pd.read_csv(self.DATASET_PATH)
+        df = pd.read_csv(self.DATASET_PATH, dtype=ConfigDataset.get_categorical_dtypes())
         total = len(df)
 
         # Cargar modelo
@@ -154,7 +157,7 @@ class AnalizadorSubjetividad:
         subjetividad = [self.ID_TO_LABEL[pred] for pred in predicted_classes]
 
         # Agregar columna al dataset
-        df['Subjetividad'] = subjetividad
+        df['Subjetividad'] = pd.Categorical(subjetividad)
 
         # Guardar dataset modificado
         df.to_csv(self.DATASET_PATH, index=False)
@@ -19,7 +19,6 @@ from transformers import logging as transformers_logging
 
 from config.config import ConfigDataset
 
-warnings.filterwarnings('ignore')
 transformers_logging.set_verbosity_error()
 
 logger = logging.getLogger(__name__)
@@ -67,12 +66,15 @@ class ClasificadorCategorias:
     def _cargar_modelo(self):
         """Carga el modelo BERT fine-tuned desde la caché local y los thresholds optimizados (si existen)."""
         cache_dir = ConfigDataset.get_models_cache_dir()
-        try:
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_id, cache_dir=cache_dir)
-        except TypeError:
-            # Si hay error, intentar sin parámetros extras
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_id, cache_dir=cache_dir)
-        self.model = AutoModelForSequenceClassification.from_pretrained(self.model_id, cache_dir=cache_dir)
+        # Avisos de deprecación de transformers al cargar el checkpoint
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)
+            try:
+                self.tokenizer = AutoTokenizer.from_pretrained(self.model_id, cache_dir=cache_dir)
+            except TypeError:
+                # Si hay error, intentar sin parámetros extras
+                self.tokenizer = AutoTokenizer.from_pretrained(self.model_id, cache_dir=cache_dir)
+            self.model = AutoModelForSequenceClassification.from_pretrained(self.model_id, cache_dir=cache_dir)
         self.model.to(self.device)
         self.model.eval()
 
@@ -92,24 +94,22 @@ class ClasificadorCategorias:
         class ReviewDataset(Dataset):
             def __init__(self, texts, tokenizer, max_length):
                 self.texts = texts
-                self.tokenizer = tokenizer
-                self.max_length = max_length
-
-            def __len__(self):
-                return len(self.texts)
-
-            def __getitem__(self, idx):
-                encoding = self.tokenizer(
-                    str(self.texts[idx]),
-                    max_length=self.max_length,
+                # Tokenizar todos los textos en una sola llamada (el tokenizador rápido procesa el lote completo)
+                self.encodings = tokenizer(
+                    [str(text) for text in texts],
+                    max_length=max_length,
                     padding='max_length',
                     truncation=True,
                     return_tensors='pt',
                 )
 
+            def __len__(self):
+                return len(self.texts)
+
+            def __getitem__(self, idx):
                 return {
-                    'input_ids': encoding['input_ids'].squeeze(0),
-                    'attention_mask': encoding['attention_mask'].squeeze(0),
+                    'input_ids': self.encodings['input_ids'][idx],
+                    'attention_mask': self.encodings['attention_mask'][idx],
                 }
 
         return ReviewDataset(texts, self.tokenizer, self.max_length)
@@ -175,7 +175,7 @@ class ClasificadorCategorias:
         Revisa si existe la columna 'Categorias' en el dataset.
         """
         try:
-            df = pd.read_csv(self.dataset_path)
+            df = pd.read_csv(self.dataset_path, nrows=0)
             return 'Categorias' in df.columns
         except Exception:
             return False
@@ -196,7 +196,7 @@ class ClasificadorCategorias:
             return
 
         # Cargar dataset
-        df = pd.read_csv(self.dataset_path)
+        df = pd.read_csv(self.dataset_path, dtype=ConfigDataset.get_categorical_dtypes())
 
         # Cargar modelo
         self._cargar_modelo()
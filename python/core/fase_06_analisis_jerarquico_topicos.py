@@ -29,11 +29,13 @@ from config.config import ConfigDataset
 from .llm_provider import LLMRetryExhaustedError, crear_chain_robusto
 
 os.environ['TOKENIZERS_PARALLELISM'] = 'false'
-warnings.filterwarnings('ignore')
 
 # Configurar logging
 logger = logging.getLogger(__name__)
 
+# Tokens compuestos solo por signos de puntuación/símbolos (se compila una vez)
+_RE_SOLO_SIMBOLOS = re.compile(r'^\W+$')
+
 
 class TopicLabel(BaseModel):
     topic_id: int = Field(..., description='ID del tópico')
@@ -57,13 +59,20 @@ class AnalizadorJerarquicoTopicos:
         Topico: {'Transporte': 'Servicio de ferry', 'Personal y servicio': 'Atención al cliente'}
     """
 
+    # Idiomas de stopwords para el vectorizador en datasets no triviales
+    IDIOMAS_STOPWORDS = ('spanish', 'english', 'portuguese', 'french', 'italian')
+
+    # Cache compartida por todas las instancias: stopwords combinadas por tupla de idiomas
+    _stopwords_cache: dict[tuple[str, ...], list[str]] = {}
+
     def __init__(self):
         self.dataset_path = str(ConfigDataset.get_dataset_path())
 
         # Determinar mínimo adaptativo basado en tamaño del dataset
         try:
-            df_temp = pd.read_csv(self.dataset_path)
-            dataset_size = len(df_temp)
+            # Solo se necesita el número de filas: se cuenta por bloques leyendo una sola columna
+            with pd.read_csv(self.dataset_path, usecols=[0], chunksize=50_000) as lector:
+                dataset_size = sum(len(bloque) for bloque in lector)
 
             # Ajustar min_opiniones según el tamaño del dataset:
             # - Datasets pequeños (<100): min 10 opiniones por categoría
@@ -97,6 +106,21 @@ class AnalizadorJerarquicoTopicos:
         self._all_texts = None
         self._text_to_idx = None
 
+    @classmethod
+    def _obtener_stopwords(cls, idiomas: tuple[str, ...]) -> list[str]:
+        """
+        Devuelve las stopwords combinadas de los idiomas indicados.
+
+        El corpus de NLTK se lee una sola vez por combinación de idiomas y se
+        reutiliza en todas las categorías (y en instancias posteriores).
+        """
+        if idiomas not in cls._stopwords_cache:
+            combinadas = set()
+            for idioma in idiomas:
+                combinadas.update(stopwords.words(idioma))
+            cls._stopwords_cache[idiomas] = list(combinadas)
+        return list(cls._stopwords_cache[idiomas])
+
     def _get_precomputed_embeddings(self, textos: list[str]) -> np.ndarray:
         """
         Retrieve pre-computed embeddings for a list of texts.
@@ -147,23 +171,25 @@ class AnalizadorJerarquicoTopicos:
         if not textos_validos:
             return {}
 
+        # Palabras por texto: se calculan una vez y se reutilizan para promedio y homogeneidad
+        longitudes = [len(t.split()) for t in textos_validos]
+
         # Características básicas
         caracteristicas = {
             'num_textos': len(textos_validos),
-            'palabras_promedio': np.mean([len(t.split()) for t in textos_validos]),
-            'homogeneidad': self._calcular_homogeneidad(textos_validos),
+            'palabras_promedio': np.mean(longitudes),
+            'homogeneidad': self._calcular_homogeneidad(longitudes),
             'diversidad_lexica': self._calcular_diversidad_lexica(textos_validos),
             'densidad_semantica': self._calcular_densidad_semantica(textos_validos),
         }
 
         return caracteristicas
 
-    def _calcular_homogeneidad(self, textos: list[str]) -> float:
-        """Calcula homogeneidad basada en variabilidad de longitudes."""
-        if len(textos) < 2:
+    def _calcular_homogeneidad(self, longitudes: list[int]) -> float:
+        """Calcula homogeneidad basada en variabilidad de longitudes (palabras por texto)."""
+        if len(longitudes) < 2:
             return 1.0
 
-        longitudes = [len(t.split()) for t in textos]
         cv_longitud = np.std(longitudes) / np.mean(longitudes) if np.mean(longitudes) > 0 else 0
         homogeneidad = 1 / (1 + cv_longitud)
 
@@ -187,7 +213,7 @@ class AnalizadorJerarquicoTopicos:
         palabras_significativas = []
         for texto in textos:
             palabras = [
-                p.lower() for p in texto.split() if len(p) > 3 and not p.isdigit() and not re.match(r'^\W+$', p)
+                p.lower() for p in texto.split() if len(p) > 3 and not p.isdigit() and not _RE_SOLO_SIMBOLOS.match(p)
             ]
             palabras_significativas.extend(palabras)
 
@@ -341,17 +367,14 @@ class AnalizadorJerarquicoTopicos:
         # Stopwords - reducir para datasets pequeños
         if num_textos < 20:
             # Solo español para datasets muy pequeños
-            stopwords_multilingues = set(stopwords.words('spanish'))
+            lista_stopwords = self._obtener_stopwords(('spanish',))
         else:
             # Multilingües para datasets más grandes
-            idiomas = ['spanish', 'english', 'portuguese', 'french', 'italian']
-            stopwords_multilingues = set()
-            for idioma in idiomas:
-                stopwords_multilingues.update(stopwords.words(idioma))
+            lista_stopwords = self._obtener_stopwords(self.IDIOMAS_STOPWORDS)
 
         return {
             'ngram_range': ngram_range,
-            'stop_words': list(stopwords_multilingues),
+            'stop_words': lista_stopwords,
             'min_df': min_df,
             'max_df': max_df,
             'max_features': max_features,
@@ -411,7 +434,7 @@ class AnalizadorJerarquicoTopicos:
         # CountVectorizer: configuración minimal
         vectorizer_model = CountVectorizer(
             ngram_range=(1, 1),
-            stop_words=list(stopwords.words('spanish')),  # Solo español
+            stop_words=self._obtener_stopwords(('spanish',)),  # Solo español
             min_df=1,
             max_df=1.0,  # No filtrar por frecuencia máxima
             max_features=None,  # Sin límite
@@ -644,22 +667,17 @@ IMPORTANTE - FORMATO JSON:
 
         return topic_names
 
-    def _analizar_categoria(self, df: pd.DataFrame, categoria: str) -> dict:
+    def _analizar_categoria(self, df: pd.DataFrame, categoria: str, posiciones: np.ndarray) -> dict:
         """
         Analiza sub-tópicos para una categoría específica.
+        `posiciones` son las posiciones (no etiquetas) de las filas de df que mencionan la categoría.
         Retorna diccionario con mapeo índice -> {categoria: nombre_tópico}.
         """
 
-        # Filtrar opiniones de esta categoría (excluyendo listas vacías [])
-        def tiene_categoria(x):
-            cats_str = str(x).strip()
-            # Excluir explícitamente listas vacías y valores nulos
-            if cats_str in ['[]', '{}', '', 'nan', 'None']:
-                return False
-            return categoria in cats_str
-
-        mask = df['Categorias'].apply(tiene_categoria)
-        df_categoria = df[mask].copy()
+        # Las posiciones se seleccionan con take y se reutilizan para traducir
+        # cada documento a su índice original sin indexar fila por fila
+        df_categoria = df.take(posiciones)
+        indices_categoria = df.index[posiciones]
 
         num_opiniones = len(df_categoria)
 
@@ -679,7 +697,10 @@ IMPORTANTE - FORMATO JSON:
         # Crear y entrenar modelo BERTopic con manejo robusto de errores
         try:
             topic_model = self._crear_bertopic(textos)
-            topics, _ = topic_model.fit_transform(textos, embeddings=cat_embeddings)
+            # UMAP/HDBSCAN avisan de parámetros ignorados (p. ej. n_jobs con random_state fijo)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', UserWarning)
+                topics, _ = topic_model.fit_transform(textos, embeddings=cat_embeddings)
         except ValueError as e:
             # Error común: parámetros incompatibles del vectorizador
             if 'max_df corresponds to' in str(e) or 'min_df' in str(e):
@@ -688,7 +709,9 @@ IMPORTANTE - FORMATO JSON:
                 try:
                     # Fallback: configuración minimalista
                     topic_model = self._crear_bertopic_fallback(textos)
-                    topics, _ = topic_model.fit_transform(textos, embeddings=cat_embeddings)
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore', UserWarning)
+                        topics, _ = topic_model.fit_transform(textos, embeddings=cat_embeddings)
                 except Exception as e2:
                     print(f'      ✗ Fallback también falló: {e2!s}')
                     return {}
@@ -747,9 +770,9 @@ IMPORTANTE - FORMATO JSON:
         mapeo_topicos = {}
         for idx, topic_id in enumerate(topics):
             # Safety: ensure idx is within bounds
-            if idx >= len(df_categoria):
+            if idx >= len(indices_categoria):
                 continue
-            original_idx = df_categoria.iloc[idx].name
+            original_idx = indices_categoria[idx]
             topico_nombre = topic_names.get(topic_id, 'Opiniones Diversas')
             mapeo_topicos[original_idx] = {categoria: topico_nombre}
 
@@ -761,7 +784,7 @@ IMPORTANTE - FORMATO JSON:
         Revisa si existe la columna 'Topico' en el dataset.
         """
         try:
-            df = pd.read_csv(self.dataset_path)
+            df = pd.read_csv(self.dataset_path, nrows=0)
             return 'Topico' in df.columns
         except Exception:
             return False
@@ -782,7 +805,7 @@ IMPORTANTE - FORMATO JSON:
             return
 
         # Cargar dataset
-        df = pd.read_csv(self.dataset_path)
+        df = pd.read_csv(self.dataset_path, dtype=ConfigDataset.get_categorical_dtypes())
 
         # Pre-compute all embeddings once for the entire dataset.
         # This avoids redundant model loads and re-encoding for reviews
@@ -801,18 +824,18 @@ IMPORTANTE - FORMATO JSON:
         todas_categorias = set()
         opiniones_sin_categoria = 0
 
-        for cats in df['Categorias']:
-            if pd.notna(cats):
-                cats_str = str(cats).strip()
-                # Detectar listas vacías explícitamente
-                if cats_str in ['[]', '{}', '']:
-                    opiniones_sin_categoria += 1
-                    continue
+        # Iterar el array subyacente (sin nulos) evita el acceso por Serie en cada fila
+        for cats in df['Categorias'].dropna().to_numpy():
+            cats_str = str(cats).strip()
+            # Detectar listas vacías explícitamente
+            if cats_str in ['[]', '{}', '']:
+                opiniones_sin_categoria += 1
+                continue
 
-                # Parsear la lista de categorías (formato string de lista)
-                cats_str = cats_str.strip('[]\'"')
-                cats_list = [c.strip() for c in cats_str.split(',')]
-                todas_categorias.update(cats_list)
+            # Parsear la lista de categorías (formato string de lista)
+            cats_str = cats_str.strip('[]\'"')
+            cats_list = [c.strip() for c in cats_str.split(',')]
+            todas_categorias.update(cats_list)
 
         # Filtrar categorías válidas (no vacías)
         categorias_validas = [c for c in todas_categorias if c and c.strip()]
@@ -828,17 +851,15 @@ IMPORTANTE - FORMATO JSON:
         categorias_procesadas = 0
         categorias_omitidas = []
 
+        # Normalizar 'Categorias' una sola vez; excluir explícitamente listas vacías y valores nulos
+        cats_str = df['Categorias'].fillna('').astype(str).str.strip()
+        con_categorias = ~cats_str.isin(['[]', '{}', '', 'nan', 'None']).to_numpy()
+
         # Procesar cada categoría con barra de progreso
         for categoria in tqdm(categorias_validas, desc='   Progreso'):
-            # Contar opiniones en esta categoría (excluyendo listas vacías)
-            def tiene_categoria(x, _cat=categoria):
-                cats_str = str(x).strip()
-                if cats_str in ['[]', '{}', '', 'nan', 'None']:
-                    return False
-                return _cat in cats_str
-
-            mask = df['Categorias'].apply(tiene_categoria)
-            num_opiniones = mask.sum()
+            # Posiciones de las opiniones de esta categoría (excluyendo listas vacías)
+            posiciones = np.flatnonzero(con_categorias & cats_str.str.contains(categoria, regex=False).to_numpy())
+            num_opiniones = len(posiciones)
 
             if num_opiniones < self.min_opiniones_categoria:
                 categorias_omitidas.append((categoria, num_opiniones))
@@ -847,7 +868,7 @@ IMPORTANTE - FORMATO JSON:
             print(f'  • {categoria}: {num_opiniones} opiniones - procesando...')
 
             # Analizar sub-tópicos
-            mapeo_topicos = self._analizar_categoria(df, categoria)
+            mapeo_topicos = self._analizar_categoria(df, categoria, posiciones)
 
             if mapeo_topicos:
                 categorias_procesadas += 1
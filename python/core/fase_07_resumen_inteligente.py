@@ -9,7 +9,6 @@ import json
 import logging
 import os
 import time
-import warnings
 from collections import defaultdict
 from datetime import datetime
 
@@ -20,8 +19,6 @@ from tqdm import tqdm
 from .llm_provider import crear_chain, get_llm
 from .llm_utils import RetryConfig
 
-warnings.filterwarnings('ignore')
-
 # Configurar logging
 logger = logging.getLogger(__name__)
 
@@ -65,11 +62,15 @@ class ResumidorInteligente:
         if not os.path.exists(self.dataset_path):
             raise FileNotFoundError(f'Dataset no encontrado: {self.dataset_path}')
 
-        self.df = pd.read_csv(self.dataset_path)
+        from config.config import ConfigDataset
+
+        # Sentimiento y Subjetividad solo toman unos pocos valores: como 'category' los filtros
+        # y agrupaciones comparan códigos enteros en lugar de cadenas
+        self.df = pd.read_csv(self.dataset_path, dtype=ConfigDataset.get_categorical_dtypes())
 
         # Verificar columnas requeridas
         columnas_requeridas = ['TituloReview', 'Sentimiento', 'Subjetividad']
-        columnas_faltantes = [col for col in columnas_requeridas if col not in self.df.columns]
+        columnas_faltantes = ConfigDataset.get_missing_columns(self.df, columnas_requeridas)
 
         if columnas_faltantes:
             raise KeyError(
@@ -200,19 +201,20 @@ class ResumidorInteligente:
         filtros_relajados: list[str] = []
 
         # ── Stage 1: Subjectivity ──────────────────────────────────────
-        df_filtrado = self.df[self.df['Subjetividad'] == 'Mixta'].copy()
+        # La columna y la máscara de 'Mixta' se obtienen una sola vez y se reutilizan en los filtros de respaldo
+        subjetividad = self.df['Subjetividad']
+        es_mixta = subjetividad.eq('Mixta')
+        df_filtrado = self.df[es_mixta].copy()
 
         if _hay_suficientes(df_filtrado):
             filtros_aplicados.append("Subjetividad = 'Mixta'")
         else:
             # Fall back: include 'Subjetiva' too
-            df_filtrado = self.df[self.df['Subjetividad'].isin(['Mixta', 'Subjetiva'])].copy()
+            df_filtrado = self.df[subjetividad.isin(['Mixta', 'Subjetiva'])].copy()
 
             if _hay_suficientes(df_filtrado):
                 filtros_aplicados.append("Subjetividad ∈ {'Mixta', 'Subjetiva'}")
-                filtros_relajados.append(
-                    f'Subjetividad: se incluyeron Subjetivas (solo {self.df["Subjetividad"].eq("Mixta").sum()} Mixtas)'
-                )
+                filtros_relajados.append(f'Subjetividad: se incluyeron Subjetivas (solo {es_mixta.sum()} Mixtas)')
             else:
                 # Fall back: use everything
                 df_filtrado = self.df.copy()
@@ -232,25 +234,27 @@ class ResumidorInteligente:
                 )
 
         # ── Stage 3: Dominant category ─────────────────────────────────
-        df_filtrado['CategoriaDominante'] = df_filtrado.index.map(lambda idx: self._obtener_categoria_dominante(idx))
+        categorias_dominantes = df_filtrado.index.map(self._obtener_categoria_dominante)
+        df_filtrado['CategoriaDominante'] = categorias_dominantes
 
-        df_con_categoria = df_filtrado[df_filtrado['CategoriaDominante'].notna()]
+        df_con_categoria = df_filtrado[categorias_dominantes.notna()]
 
         if _hay_suficientes(df_con_categoria):
             df_filtrado = df_con_categoria
             filtros_aplicados.append('Tiene categoría dominante')
         else:
             # Assign a fallback category so the pipeline can continue
-            df_filtrado['CategoriaDominante'] = df_filtrado['CategoriaDominante'].fillna('General')
+            df_filtrado['CategoriaDominante'] = categorias_dominantes.fillna('General')
             filtros_relajados.append(
                 f"Categoría: {df_filtrado['CategoriaDominante'].eq('General').sum()} reseñas asignadas a 'General'"
             )
 
         # ── Stage 4: Relevant topic ───────────────────────────────────
-        topicos_relevantes = []
-        for idx, row in df_filtrado.iterrows():
-            topico = self._obtener_topico_para_categoria(idx, row['CategoriaDominante'])
-            topicos_relevantes.append(topico if topico else 'General')
+        # Solo se necesitan índice y categoría: zip evita construir una Serie por fila (iterrows)
+        topicos_relevantes = [
+            self._obtener_topico_para_categoria(idx, categoria) or 'General'
+            for idx, categoria in zip(df_filtrado.index, df_filtrado['CategoriaDominante'])
+        ]
         df_filtrado = df_filtrado.copy()
         df_filtrado['TopicoRelevante'] = topicos_relevantes
 
@@ -277,20 +281,17 @@ class ResumidorInteligente:
         if tiene_topicos_reales:
             columnas_grupo.append('TopicoRelevante')
 
-        reseñas_seleccionadas = []
-        agrupaciones = df_filtrado.groupby(columnas_grupo, dropna=False)
-
-        for _, grupo in agrupaciones:
-            sort_cols = ['Longitud']
-            sort_asc = [False]
-            if tiene_fecha:
-                sort_cols.append('FechaEstadia')
-                sort_asc.append(False)
-
-            grupo_ordenado = grupo.sort_values(by=sort_cols, ascending=sort_asc)
-            reseñas_seleccionadas.append(grupo_ordenado.iloc[0])
+        sort_cols = ['Longitud']
+        if tiene_fecha:
+            sort_cols.append('FechaEstadia')
 
-        df_seleccionado = pd.DataFrame(reseñas_seleccionadas)
+        # Una sola ordenación (por grupo y, dentro de cada grupo, más larga y más reciente primero);
+        # la primera fila de cada combinación es la seleccionada
+        df_seleccionado = df_filtrado.sort_values(
+            by=columnas_grupo + sort_cols,
+            ascending=[True] * len(columnas_grupo) + [False] * len(sort_cols),
+            kind='stable',
+        ).drop_duplicates(subset=columnas_grupo, keep='first')
 
         # ── Final safety net ──────────────────────────────────────────
         # If STILL empty after all relaxations, take the longest reviews
@@ -304,26 +305,32 @@ class ResumidorInteligente:
             filtros_relajados.append(f'Fallback: se usaron las {n_fallback} reseñas más largas sin filtrar')
 
         # ── Report ────────────────────────────────────────────────────
-        print(f'   ✓ Reseñas seleccionadas: {len(df_seleccionado)} de {total}')
-        print(f'   ✓ Reducción: {total - len(df_seleccionado)} reseñas filtradas')
+        # Se arma el reporte completo y se imprime de una sola vez
+        lineas = [
+            f'   ✓ Reseñas seleccionadas: {len(df_seleccionado)} de {total}',
+            f'   ✓ Reducción: {total - len(df_seleccionado)} reseñas filtradas',
+        ]
 
         if filtros_aplicados:
-            print(f'   • Filtros aplicados ({len(filtros_aplicados)}):')
-            for f in filtros_aplicados:
-                print(f'     ✓ {f}')
+            lineas.append(f'   • Filtros aplicados ({len(filtros_aplicados)}):')
+            lineas.extend(f'     ✓ {f}' for f in filtros_aplicados)
 
         if filtros_relajados:
-            print(f'   • Filtros relajados ({len(filtros_relajados)}):')
-            for f in filtros_relajados:
-                print(f'     ⚠️  {f}')
-
-        print('   • Por categoría:')
-        for categoria, count in df_seleccionado['CategoriaDominante'].value_counts().items():
-            if 'TopicoRelevante' in df_seleccionado.columns:
-                n_sub = df_seleccionado[df_seleccionado['CategoriaDominante'] == categoria]['TopicoRelevante'].nunique()
-                print(f'     - {categoria}: {count} reseñas, {n_sub} subtópicos')
-            else:
-                print(f'     - {categoria}: {count} reseñas')
+            lineas.append(f'   • Filtros relajados ({len(filtros_relajados)}):')
+            lineas.extend(f'     ⚠️  {f}' for f in filtros_relajados)
+
+        lineas.append('   • Por categoría:')
+        conteos = df_seleccionado['CategoriaDominante'].value_counts()
+        if 'TopicoRelevante' in df_seleccionado.columns:
+            subtopicos = df_seleccionado.groupby('CategoriaDominante')['TopicoRelevante'].nunique()
+            lineas.extend(
+                f'     - {categoria}: {count} reseñas, {subtopicos[categoria]} subtópicos'
+                for categoria, count in conteos.items()
+            )
+        else:
+            lineas.extend(f'     - {categoria}: {count} reseñas' for categoria, count in conteos.items())
+
+        print('\n'.join(lineas))
 
         return df_seleccionado
 
@@ -346,30 +353,14 @@ class ResumidorInteligente:
         if 'CategoriaDominante' not in df.columns or 'TopicoRelevante' not in df.columns:
             return df
 
-        dfs_filtrados = []
-
-        for categoria in df['CategoriaDominante'].unique():
-            # Filtrar reseñas de esta categoría
-            df_categoria = df[df['CategoriaDominante'] == categoria].copy()
-
-            # Contar frecuencia de subtópicos
-            conteo_subtopicos = df_categoria['TopicoRelevante'].value_counts()
-
-            # Seleccionar top N subtópicos
-            top_subtopicos = conteo_subtopicos.head(self.top_n_subtopicos).index.tolist()
-
-            # Filtrar solo esos subtópicos
-            df_top = df_categoria[df_categoria['TopicoRelevante'].isin(top_subtopicos)]
-
-            dfs_filtrados.append(df_top)
-
-        if not dfs_filtrados:
-            return df
-
-        # Concatenar todos los DataFrames filtrados
-        df_resultado = pd.concat(dfs_filtrados, ignore_index=False)
+        # Marcar, dentro de cada categoría, las reseñas cuyo subtópico está en el top N.
+        # Una sola máscara sobre el DataFrame original evita copiar cada categoría
+        # por separado y volver a concatenarlas al final.
+        es_top = df.groupby('CategoriaDominante', sort=False)['TopicoRelevante'].transform(
+            lambda subtopicos: subtopicos.isin(subtopicos.value_counts().head(self.top_n_subtopicos).index)
+        )
 
-        return df_resultado
+        return df[es_top.eq(True)]
 
     def _inicializar_llm(self):
         """Inicializa el modelo LLM para generación de resúmenes."""
@@ -387,14 +378,15 @@ class ResumidorInteligente:
         Returns:
             Texto del resumen
         """
-        # Preparar contexto de reseñas
-        contexto_reseñas = ''
+        # Preparar contexto de reseñas (se unen al final en vez de concatenar en cada iteración)
+        bloques_reseñas = []
         for i, reseña in enumerate(reseñas, 1):
             sentimiento = reseña.get('Sentimiento', 'Desconocido')
             topico = reseña.get('TopicoRelevante', 'General')
             texto = reseña.get('TituloReview', '')[:500]  # Limitar longitud
 
-            contexto_reseñas += f'\n[Reseña {i}] Sentimiento: {sentimiento} | Subtópico: {topico}\n{texto}\n'
+            bloques_reseñas.append(f'\n[Reseña {i}] Sentimiento: {sentimiento} | Subtópico: {topico}\n{texto}\n')
+        contexto_reseñas = ''.join(bloques_reseñas)
 
         # Template for structured summary
         analysis_language = os.environ.get('ANALYSIS_LANGUAGE', 'es')
@@ -662,9 +654,8 @@ REGLAS DE FORMATO IMPORTANTES:
         # Agrupar reseñas por categoría dominante
         reseñas_por_categoria = defaultdict(list)
 
-        for _, row in df_seleccionado.iterrows():
-            categoria = row['CategoriaDominante']
-            reseñas_por_categoria[categoria].append(row.to_dict())
+        for reseña in df_seleccionado.to_dict('records'):
+            reseñas_por_categoria[reseña['CategoriaDominante']].append(reseña)
 
         # Calcular total de tareas para la barra de progreso
         total_tareas = len(tipos_resumen) * (len(reseñas_por_categoria) + 1)  # +1 por resumen global
@@ -16,7 +16,6 @@ import logging
 import os
 import threading
 import time
-import warnings
 from collections import Counter, defaultdict
 from collections.abc import Callable
 from datetime import datetime
@@ -27,8 +26,6 @@ import pandas as pd
 from .llm_provider import crear_chain, get_llm
 from .llm_utils import RetryConfig
 
-warnings.filterwarnings('ignore')
-
 logger = logging.getLogger(__name__)
 
 
@@ -59,7 +56,7 @@ class GeneradorInsightsEstrategicos:
         self.structured_summary = None
         self.llm = None
         self.progress_callback = progress_callback
-        self._llm_in_progress = False
+        self._llm_terminado = threading.Event()
         self._llm_progress_thread = None
 
     # ── Data Loading ─────────────────────────────────────────────────
@@ -71,15 +68,14 @@ class GeneradorInsightsEstrategicos:
 
     def _simulate_llm_progress(self, start_pct: int, end_pct: int, duration_seconds: float = 30):
         """Simulate progress during LLM call by gradually updating from start_pct to end_pct."""
-        self._llm_in_progress = True
         steps = 20  # Update progress 20 times
         interval = duration_seconds / steps
         progress_increment = (end_pct - start_pct) / steps
 
         for i in range(steps):
-            if not self._llm_in_progress:
+            # Event.wait returns as soon as the LLM call finishes instead of sleeping the full interval
+            if self._llm_terminado.wait(interval):
                 break
-            time.sleep(interval)
             current_progress = int(start_pct + (progress_increment * (i + 1)))
             self._report_progress(current_progress, 'Generando insights estratégicos con LLM...')
 
@@ -90,10 +86,13 @@ class GeneradorInsightsEstrategicos:
         if not os.path.exists(self.dataset_path):
             raise FileNotFoundError(f'Dataset not found: {self.dataset_path}')
 
-        self.df = pd.read_csv(self.dataset_path)
+        from config.config import ConfigDataset
+
+        # Label columns as 'category' so the per-sentiment counts work on integer codes
+        self.df = pd.read_csv(self.dataset_path, dtype=ConfigDataset.get_categorical_dtypes())
 
         required = ['TituloReview', 'Sentimiento', 'Subjetividad']
-        missing = [c for c in required if c not in self.df.columns]
+        missing = ConfigDataset.get_missing_columns(self.df, required)
         if missing:
             raise KeyError(
                 f'Required columns missing: {", ".join(missing)}\n   Ensure Phases 01, 03 and 04 have been executed.'
@@ -133,10 +132,13 @@ class GeneradorInsightsEstrategicos:
         total = len(self.df)
         sections: list[str] = []
 
+        # One pass over the sentiment column feeds both the KPIs and the distribution table
+        sent_counts = self.df['Sentimiento'].value_counts()
+
         # ── 1. Overview KPIs ──
-        pct_pos = round((self.df['Sentimiento'] == 'Positivo').sum() / total * 100, 1)
-        pct_neu = round((self.df['Sentimiento'] == 'Neutro').sum() / total * 100, 1)
-        pct_neg = round((self.df['Sentimiento'] == 'Negativo').sum() / total * 100, 1)
+        pct_pos = round(sent_counts.get('Positivo', 0) / total * 100, 1)
+        pct_neu = round(sent_counts.get('Neutro', 0) / total * 100, 1)
+        pct_neg = round(sent_counts.get('Negativo', 0) / total * 100, 1)
         avg_rating = round(float(self.df['Calificacion'].mean()), 2) if 'Calificacion' in self.df.columns else 'N/A'
         median_rating = float(self.df['Calificacion'].median()) if 'Calificacion' in self.df.columns else 'N/A'
 
@@ -152,7 +154,6 @@ class GeneradorInsightsEstrategicos:
         )
 
         # ── 2. Sentiment Distribution ──
-        sent_counts = self.df['Sentimiento'].value_counts()
         rows = []
         for label in ['Positivo', 'Neutro', 'Negativo']:
             cnt = int(sent_counts.get(label, 0))
@@ -576,6 +577,7 @@ REGLAS CRÍTICAS DE FORMATO:
 
         # Start simulated progress in background thread
         if self.progress_callback:
+            self._llm_terminado.clear()
             self._llm_progress_thread = threading.Thread(
                 target=self._simulate_llm_progress,
                 args=(50, 85, 30),  # Progress from 50% to 85% over ~30 seconds
@@ -595,8 +597,8 @@ REGLAS CRÍTICAS DE FORMATO:
             )
             return result.strip() if result else '[Could not generate strategic insights]'
         finally:
-            # Stop simulated progress
-            self._llm_in_progress = False
+            # Stop simulated progress (wakes the thread immediately)
+            self._llm_terminado.set()
             if self._llm_progress_thread:
                 self._llm_progress_thread.join(timeout=1)
             self._report_progress(90, 'Insights generados')
@@ -26,7 +26,6 @@ Características:
 import json
 import logging
 import shutil
-import warnings
 from datetime import datetime
 from pathlib import Path
 
@@ -44,10 +43,34 @@ from .visualizaciones.generador_topicos import GeneradorTopicos
 from .visualizaciones.utils import configurar_estilo_grafico, configurar_tema
 from .visualizaciones.validador import ValidadorVisualizaciones
 
-warnings.filterwarnings('ignore')
-
 logger = logging.getLogger(__name__)
 
+# Temas en los que se renderiza cada visualización
+TEMAS = ('light', 'dark')
+
+# Secciones a generar (solo gráficos puros): (nombre, clase generadora)
+# Note: Dashboard section is deprecated and no longer generated
+SECCIONES = (
+    ('Sentimientos', GeneradorSentimientos),
+    ('Subjetividad', GeneradorSubjetividad),
+    ('Categorías', GeneradorCategorias),
+    ('Tópicos', GeneradorTopicos),
+    ('Temporal', GeneradorTemporal),
+    ('Texto', GeneradorTexto),
+    ('Análisis Cruzado', GeneradorCombinados),
+)
+
+# Clave de sección en el reporte → carpeta en disco
+SECCION_CARPETAS = {
+    'sentimientos': '01_sentimientos',
+    'subjetividad': '02_subjetividad',
+    'categorias': '03_categorias',
+    'topicos': '04_topicos',
+    'temporal': '05_temporal',
+    'texto': '06_texto',
+    'combinados': '07_combinados',
+}
+
 
 class GeneradorVisualizaciones:
     """
@@ -81,11 +104,9 @@ class GeneradorVisualizaciones:
         """
         light_dir = self.output_dir / 'light'
         dark_dir = self.output_dir / 'dark'
+        # any() se detiene en el primer PNG en lugar de listar todo el árbol
         return (
-            light_dir.exists()
-            and len(list(light_dir.rglob('*.png'))) > 0
-            and dark_dir.exists()
-            and len(list(dark_dir.rglob('*.png'))) > 0
+            light_dir.exists() and any(light_dir.rglob('*.png')) and dark_dir.exists() and any(dark_dir.rglob('*.png'))
         )
 
     def _limpiar_visualizaciones_previas(self):
@@ -143,28 +164,13 @@ class GeneradorVisualizaciones:
         # 5. Generar visualizaciones por sección (light y dark)
         print('\n📊 Generando visualizaciones...')
 
-        # Lista de secciones a generar (solo gráficos puros)
-        # Note: Dashboard section is deprecated and no longer generated
-        secciones = [
-            ('Sentimientos', GeneradorSentimientos),
-            ('Subjetividad', GeneradorSubjetividad),
-            ('Categorías', GeneradorCategorias),
-            ('Tópicos', GeneradorTopicos),
-            ('Temporal', GeneradorTemporal),
-            ('Texto', GeneradorTexto),
-            ('Análisis Cruzado', GeneradorCombinados),
-        ]
-
         # Build a flat list of (theme, section_name, generator_class) for a single progress bar
-        tareas = []
-        for tema in ['light', 'dark']:
-            for nombre, generador_class in secciones:
-                tareas.append((tema, nombre, generador_class))
+        tareas = [(tema, nombre, generador_class) for tema in TEMAS for nombre, generador_class in SECCIONES]
 
         tema_actual = None
         for tema, nombre, generador_class in tqdm(tareas, desc='   Progreso'):
             if tema != tema_actual:
-                print(f'\n🎨 Generando versión [{tema}]...')
+                logger.debug('Generando versión [%s]...', tema)
                 configurar_tema(tema)
                 configurar_estilo_grafico()
                 tema_actual = tema
@@ -187,15 +193,18 @@ class GeneradorVisualizaciones:
         actual_count = reporte['visualizaciones']['total_generadas']
         actual_omitidas = reporte['visualizaciones']['total_omitidas']
 
-        print('\n' + '=' * 60)
-        print('✅ Visualizaciones generadas exitosamente')
-        print(f'   • Total generadas: {actual_count} (×2 temas: light + dark)')
-        print(f'   • Total omitidas: {actual_omitidas}')
-        print(f'   • Versión light: {self.output_dir}/light/')
-        print(f'   • Versión dark:  {self.output_dir}/dark/')
-        print(f'   • Insights textuales: {self.output_dir}/insights_textuales.json')
-        print(f'   • Reporte: {self.output_dir}/reporte_generacion.json')
-        print('=' * 60)
+        lineas = [
+            '\n' + '=' * 60,
+            '✅ Visualizaciones generadas exitosamente',
+            f'   • Total generadas: {actual_count} (×2 temas: light + dark)',
+            f'   • Total omitidas: {actual_omitidas}',
+            f'   • Versión light: {self.output_dir}/light/',
+            f'   • Versión dark:  {self.output_dir}/dark/',
+            f'   • Insights textuales: {self.output_dir}/insights_textuales.json',
+            f'   • Reporte: {self.output_dir}/reporte_generacion.json',
+            '=' * 60,
+        ]
+        print('\n'.join(lineas))
 
     def _cargar_datos(self):
         """Carga el dataset procesado."""
@@ -204,7 +213,11 @@ class GeneradorVisualizaciones:
                 f'Dataset no encontrado: {self.dataset_path}\nAsegúrate de ejecutar las Fases 01-07 primero.'
             )
 
-        self.df = pd.read_csv(self.dataset_path)
+        from config.config import ConfigDataset
+
+        # Etiquetas de baja cardinalidad como 'category': menos memoria y comparaciones,
+        # conteos y tablas cruzadas más rápidas
+        self.df = pd.read_csv(self.dataset_path, dtype=ConfigDataset.get_categorical_dtypes())
         print(f'\n📂 Dataset cargado: {len(self.df)} opiniones')
 
     def _validar_dataset(self):
@@ -212,39 +225,32 @@ class GeneradorVisualizaciones:
         self.validador = ValidadorVisualizaciones(self.df)
         resumen = self.validador.get_resumen()
 
-        print('\n🔍 Validación del dataset:')
-        print(f'   • Total opiniones: {resumen["total_opiniones"]}')
-        print(f'   • Fechas válidas: {"✓" if resumen["tiene_fechas"] else "✗ (análisis temporal no disponible)"}')
-        print(
-            f'   • Calificación: {"✓" if resumen["tiene_calificacion"] else "✗ (generada por el modelo de sentimientos)"}'
-        )
-
+        # Se arma el bloque completo y se imprime de una vez (una sola escritura a stdout)
+        sentimientos = resumen['diversidad_sentimientos']
+        lineas = [
+            '\n🔍 Validación del dataset:',
+            f'   • Total opiniones: {resumen["total_opiniones"]}',
+            f'   • Fechas válidas: {"✓" if resumen["tiene_fechas"] else "✗ (análisis temporal no disponible)"}',
+            f'   • Calificación: {"✓" if resumen["tiene_calificacion"] else "✗ (generada por el modelo de sentimientos)"}',
+        ]
         if resumen['tiene_fechas']:
-            print(f'   • Rango temporal: {resumen["rango_temporal_dias"]} días')
-
-        print(f'   • Categorías válidas: {resumen["categorias_validas"]}')
-        print(f'   • Tópicos detectados: {"✓" if resumen["tiene_topicos"] else "✗"}')
-        print('   • Sentimientos:')
-        print(f'     - Positivo: {resumen["diversidad_sentimientos"]["positivo"]}')
-        print(f'     - Neutro: {resumen["diversidad_sentimientos"]["neutro"]}')
-        print(f'     - Negativo: {resumen["diversidad_sentimientos"]["negativo"]}')
+            lineas.append(f'   • Rango temporal: {resumen["rango_temporal_dias"]} días')
+        lineas += [
+            f'   • Categorías válidas: {resumen["categorias_validas"]}',
+            f'   • Tópicos detectados: {"✓" if resumen["tiene_topicos"] else "✗"}',
+            '   • Sentimientos:',
+            f'     - Positivo: {sentimientos["positivo"]}',
+            f'     - Neutro: {sentimientos["neutro"]}',
+            f'     - Negativo: {sentimientos["negativo"]}',
+        ]
+        print('\n'.join(lineas))
 
     def _crear_carpetas(self):
         """Crea la estructura de carpetas para las visualizaciones (light y dark)."""
-        carpetas = [
-            '01_sentimientos',
-            '02_subjetividad',
-            '03_categorias',
-            '04_topicos',
-            '05_temporal',
-            '06_texto',
-            '07_combinados',
-        ]
-
-        for tema in ['light', 'dark']:
+        for tema in TEMAS:
             tema_dir = self.output_dir / tema
             tema_dir.mkdir(parents=True, exist_ok=True)
-            for carpeta in carpetas:
+            for carpeta in SECCION_CARPETAS.values():
                 (tema_dir / carpeta).mkdir(parents=True, exist_ok=True)
 
     def _generar_seccion(self, nombre: str, GeneradorClass, output_dir: Path = None):
@@ -257,7 +263,8 @@ class GeneradorVisualizaciones:
             output_dir: Directorio de salida (si None, usa self.output_dir)
         """
         target_dir = output_dir or self.output_dir
-        print(f'\n   [{nombre}] Generando visualizaciones...')
+        # Mensajes de depuración con argumentos diferidos: no se formatean si DEBUG está desactivado
+        logger.debug('[%s] Generando visualizaciones...', nombre)
 
         try:
             generador = GeneradorClass(self.df, self.validador, target_dir)
@@ -265,18 +272,18 @@ class GeneradorVisualizaciones:
 
             self.visualizaciones_generadas.extend(generadas)
 
-            print(f'   ✓ {nombre}: {len(generadas)} visualizaciones generadas')
+            logger.debug('%s: %d visualizaciones generadas', nombre, len(generadas))
 
         except Exception as e:
             print(f'   ⚠️  Error en {nombre}: {e}')
 
     def _exportar_insights(self):
         """Exporta insights textuales a JSON para la UI."""
-        print('\n   [Insights] Exportando datos textuales...')
+        logger.debug('[Insights] Exportando datos textuales...')
         try:
             exportador = ExportadorInsights(self.df, self.validador, self.output_dir)
             nombre = exportador.exportar()
-            print(f'   ✓ Insights textuales exportados: {nombre}')
+            logger.debug('Insights textuales exportados: %s', nombre)
         except Exception as e:
             print(f'   ⚠️  Error exportando insights: {e}')
 
@@ -288,23 +295,12 @@ class GeneradorVisualizaciones:
         """
         resumen_validacion = self.validador.get_resumen()
 
-        # Map section names to their folder names on disk
-        seccion_carpetas = {
-            'sentimientos': '01_sentimientos',
-            'subjetividad': '02_subjetividad',
-            'categorias': '03_categorias',
-            'topicos': '04_topicos',
-            'temporal': '05_temporal',
-            'texto': '06_texto',
-            'combinados': '07_combinados',
-        }
-
         # Scan actual files from disk (use 'light' theme as reference)
         light_dir = self.output_dir / 'light'
         por_seccion = {}
         lista_generadas = []
 
-        for seccion, carpeta in seccion_carpetas.items():
+        for seccion, carpeta in SECCION_CARPETAS.items():
             carpeta_path = light_dir / carpeta
             if carpeta_path.exists():
                 pngs = sorted([f.stem for f in carpeta_path.glob('*.png')])
@@ -32,6 +32,9 @@ class ExportadorInsights:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # KPIs, fortalezas y debilidades comparten el mismo cálculo por categoría
+        self._fortalezas_debilidades = None
+
         # Ruta para resúmenes generados por LLM (Fase 07)
         from config.config import ConfigDataset
 
@@ -114,9 +117,11 @@ class ExportadorInsights:
     def _exportar_kpis(self) -> dict[str, Any]:
         """Exporta los KPIs principales."""
         total_opiniones = len(self.df)
-        pct_positivo = (self.df['Sentimiento'] == 'Positivo').sum() / total_opiniones * 100
-        pct_neutro = (self.df['Sentimiento'] == 'Neutro').sum() / total_opiniones * 100
-        pct_negativo = (self.df['Sentimiento'] == 'Negativo').sum() / total_opiniones * 100
+        # Un solo conteo de la columna en lugar de una máscara por sentimiento
+        porcentajes = self.df['Sentimiento'].value_counts() / total_opiniones * 100
+        pct_positivo = porcentajes.get('Positivo', 0.0)
+        pct_neutro = porcentajes.get('Neutro', 0.0)
+        pct_negativo = porcentajes.get('Negativo', 0.0)
         calificacion_prom = float(self.df['Calificacion'].mean()) if 'Calificacion' in self.df.columns else 0.0
 
         fortalezas_debilidades = self._calcular_fortalezas_debilidades()
@@ -175,6 +180,9 @@ class ExportadorInsights:
 
     def _calcular_fortalezas_debilidades(self) -> dict[str, list[dict]]:
         """Calcula fortalezas y debilidades por categoría, incluyendo subtópico principal."""
+        if self._fortalezas_debilidades is not None:
+            return self._fortalezas_debilidades
+
         cat_sentimientos = defaultdict(lambda: {'Positivo': 0, 'Neutro': 0, 'Negativo': 0})
         cat_subtopicos = defaultdict(Counter)  # category -> Counter of subtopics
 
@@ -243,42 +251,43 @@ class ExportadorInsights:
         fortalezas.sort(key=lambda x: x['porcentaje_positivo'], reverse=True)
         debilidades.sort(key=lambda x: x['porcentaje_negativo'], reverse=True)
 
-        return {'fortalezas': fortalezas, 'debilidades': debilidades}
+        self._fortalezas_debilidades = {'fortalezas': fortalezas, 'debilidades': debilidades}
+        return self._fortalezas_debilidades
 
-    def _contar_subtopicos(self) -> int:
-        """Cuenta el número de subtópicos únicos detectados."""
+    def _contar_menciones_subtopicos(self) -> Counter:
+        """
+        Cuenta las menciones de cada subtópico en la columna 'Topico'.
+
+        Los diccionarios de tópicos se repiten mucho entre reseñas, así que cada
+        valor distinto se parsea una sola vez y se pondera por su frecuencia.
+        """
+        conteo: Counter = Counter()
         if 'Topico' not in self.df.columns:
-            return 0
+            return conteo
 
-        subtopicos_unicos = set()
-        for topico_str in self.df['Topico'].dropna():
+        for topico_str, repeticiones in self.df['Topico'].dropna().astype(str).value_counts(sort=False).items():
+            if topico_str.strip() in ['{}', 'nan', 'None', '']:
+                continue
             try:
-                if topico_str and str(topico_str).strip() not in ['{}', 'nan', 'None', '']:
-                    topico_dict = ast.literal_eval(str(topico_str))
-                    subtopicos_unicos.update(topico_dict.values())
+                topico_dict = ast.literal_eval(topico_str)
+                for subtopico in topico_dict.values():
+                    conteo[subtopico] += repeticiones
             except Exception:
                 continue
 
-        return len(subtopicos_unicos)
+        return conteo
+
+    def _contar_subtopicos(self) -> int:
+        """Cuenta el número de subtópicos únicos detectados."""
+        return len(self._contar_menciones_subtopicos())
 
     def _obtener_subtopico_top(self) -> str:
         """Obtiene el subtópico más mencionado."""
-        if 'Topico' not in self.df.columns:
+        conteo = self._contar_menciones_subtopicos()
+        if not conteo:
             return 'N/A'
 
-        todos_subtopicos = []
-        for topico_str in self.df['Topico'].dropna():
-            try:
-                if topico_str and str(topico_str).strip() not in ['{}', 'nan', 'None', '']:
-                    topico_dict = ast.literal_eval(str(topico_str))
-                    todos_subtopicos.extend(topico_dict.values())
-            except Exception:
-                continue
-
-        if not todos_subtopicos:
-            return 'N/A'
-
-        return Counter(todos_subtopicos).most_common(1)[0][0]
+        return conteo.most_common(1)[0][0]
 
     def _exportar_estadisticas_dataset(self) -> dict[str, Any]:
         """
@@ -290,13 +299,16 @@ class ExportadorInsights:
 
         # ── Sentimiento ──
         if 'Sentimiento' in self.df.columns:
-            sent_counts = self.df['Sentimiento'].value_counts()
+            # reindex alinea las tres etiquetas (0 si falta alguna) en una sola operación
+            sent_counts = (
+                self.df['Sentimiento'].value_counts().reindex(['Positivo', 'Neutro', 'Negativo'], fill_value=0)
+            )
             stats['sentimiento'] = {
                 label: {
-                    'cantidad': int(sent_counts.get(label, 0)),
-                    'porcentaje': round(int(sent_counts.get(label, 0)) / total * 100, 1) if total else 0,
+                    'cantidad': int(cantidad),
+                    'porcentaje': round(int(cantidad) / total * 100, 1) if total else 0,
                 }
-                for label in ['Positivo', 'Neutro', 'Negativo']
+                for label, cantidad in sent_counts.items()
             }
         else:
             stats['sentimiento'] = None
@@ -363,14 +375,7 @@ class ExportadorInsights:
 
         # ── Tópicos (subtopics) ──
         if 'Topico' in self.df.columns:
-            subtopic_counter: Counter = Counter()
-            for topico_str in self.df['Topico'].dropna():
-                try:
-                    if topico_str and str(topico_str).strip() not in ['{}', 'nan', 'None', '']:
-                        topico_dict = ast.literal_eval(str(topico_str))
-                        subtopic_counter.update(topico_dict.values())
-                except Exception:
-                    continue
+            subtopic_counter = self._contar_menciones_subtopicos()
             stats['topicos'] = [
                 {'nombre': name, 'cantidad': count, 'porcentaje': round(count / total * 100, 1) if total else 0}
                 for name, count in subtopic_counter.most_common(15)
@@ -4,7 +4,6 @@ Generador de Análisis de Categorías
 Sección 3: Categorías (visualizaciones esenciales)
 """
 
-import ast
 from collections import defaultdict
 from pathlib import Path
 
@@ -14,7 +13,15 @@ import pandas as pd
 import seaborn as sns
 
 from .i18n import get_category_labels, get_sentiment_labels, get_translator, translate_categories
-from .utils import COLORES, COLORES_SENTIMIENTO, ESTILOS, FONT_SIZES, PALETA_CATEGORIAS, guardar_figura
+from .utils import (
+    COLORES,
+    COLORES_SENTIMIENTO,
+    ESTILOS,
+    FONT_SIZES,
+    PALETA_CATEGORIAS,
+    guardar_figura,
+    parsear_categorias,
+)
 
 
 class GeneradorCategorias:
@@ -25,6 +32,7 @@ class GeneradorCategorias:
         self.validador = validador
         self.output_dir = output_dir / '03_categorias'
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._categorias_sentimientos = None
 
     def generar_todas(self) -> list[str]:
         """Genera visualizaciones esenciales de categorías."""
@@ -61,55 +69,43 @@ class GeneradorCategorias:
         return generadas
 
     def _extraer_categorias_sentimientos(self):
-        """Extrae categorías con sus sentimientos asociados."""
-        cat_sentimientos = defaultdict(lambda: {'Positivo': 0, 'Neutro': 0, 'Negativo': 0})
+        """Extrae categorías con sus sentimientos asociados (se calcula una vez por instancia)."""
+        if self._categorias_sentimientos is not None:
+            return self._categorias_sentimientos
 
-        for _, row in self.df.iterrows():
-            try:
-                cats_str = str(row['Categorias']).strip()
-                # Excluir listas vacías explícitamente
-                if cats_str in ['[]', '{}', '', 'nan', 'None']:
-                    continue
-
-                # Parse list string properly
-                cats_list = ast.literal_eval(cats_str)
-                if not isinstance(cats_list, list):
-                    continue
-                sentimiento = str(row['Sentimiento'])
-
-                for cat in cats_list:
-                    if sentimiento in cat_sentimientos[cat]:
-                        cat_sentimientos[cat][sentimiento] += 1
-            except Exception:
-                continue
+        cat_sentimientos = defaultdict(lambda: {'Positivo': 0, 'Neutro': 0, 'Negativo': 0})
+        if 'Categorias' not in self.df.columns or 'Sentimiento' not in self.df.columns:
+            return cat_sentimientos
+
+        # Una fila por mención (categoría, sentimiento) y un solo conteo agrupado
+        menciones = pd.DataFrame(
+            {
+                'Categoria': self.df['Categorias'].map(parsear_categorias),
+                'Sentimiento': self.df['Sentimiento'].astype(str),
+            }
+        ).explode('Categoria')
+        menciones = menciones[menciones['Categoria'].notna()]
+
+        conteos = (
+            menciones.groupby(['Categoria', 'Sentimiento'], sort=False)
+            .size()
+            .unstack(fill_value=0)
+            .reindex(index=menciones['Categoria'].unique(), columns=['Positivo', 'Neutro', 'Negativo'], fill_value=0)
+        )
+        cat_sentimientos.update(conteos.to_dict('index'))
 
+        self._categorias_sentimientos = cat_sentimientos
         return cat_sentimientos
 
     def _generar_top_categorias(self):
         """3.1 Top Categorías Mencionadas."""
-        cats_counter = {}
-        for cats in self.df['Categorias'].dropna():
-            try:
-                cats_str = str(cats).strip()
-                # Excluir listas vacías explícitamente
-                if cats_str in ['[]', '{}', '']:
-                    continue
-
-                # Parse list string properly
-                cats_list = ast.literal_eval(cats_str)
-                if not isinstance(cats_list, list):
-                    continue
-                for cat in cats_list:
-                    cats_counter[cat] = cats_counter.get(cat, 0) + 1
-            except Exception:
-                continue
+        # Menciones por categoría, ya ordenadas por frecuencia en una sola llamada
+        conteo = self.df['Categorias'].map(parsear_categorias).explode().dropna().value_counts(sort=True)
 
-        if not cats_counter:
+        if conteo.empty:
             return
 
-        # Ordenar por frecuencia
-        cats_ordenadas = sorted(cats_counter.items(), key=lambda x: x[1], reverse=True)
-        categorias, valores = zip(*cats_ordenadas)
+        categorias, valores = conteo.index.tolist(), conteo.tolist()
 
         fig, ax = plt.subplots(figsize=(12, 8), facecolor=COLORES['fondo'])
 
@@ -314,16 +310,7 @@ class GeneradorCategorias:
 
     def _extraer_categorias_por_fila(self, row) -> list[str]:
         """Extrae lista de categorías de una fila."""
-        cats = row.get('Categorias', '')
-        if pd.isna(cats) or str(cats).strip() in ['', '[]', 'nan']:
-            return []
-        try:
-            cats_str = str(cats).strip()
-            # Parse list string properly
-            cats_list = ast.literal_eval(cats_str)
-            return cats_list if isinstance(cats_list, list) else []
-        except Exception:
-            return []
+        return parsear_categorias(row.get('Categorias', ''))
 
     def _generar_matriz_coocurrencia(self):
         """3.5 Matriz de Co-ocurrencia de Categorías.
@@ -332,14 +319,12 @@ class GeneradorCategorias:
         juntos en la misma opinión. Revela conexiones temáticas entre aspectos
         turísticos (ej. 'Gastronomía' y 'Servicio' mencionados juntos).
         """
+        if 'Categorias' not in self.df.columns:
+            return
+
         # Construir matriz de co-ocurrencia
-        todas_cats = set()
-        filas_cats = []
-        for _, row in self.df.iterrows():
-            cats = self._extraer_categorias_por_fila(row)
-            if len(cats) >= 2:
-                filas_cats.append(cats)
-                todas_cats.update(cats)
+        listas_cats = self.df['Categorias'].map(parsear_categorias)
+        todas_cats = set(listas_cats[listas_cats.str.len() >= 2].explode())
 
         if len(todas_cats) < 3:
             return
@@ -347,23 +332,18 @@ class GeneradorCategorias:
         categorias_ordenadas = sorted(todas_cats)
         cat_labels = get_category_labels()
         categorias_ordenadas_display = translate_categories(categorias_ordenadas, cat_labels)
-        cat_idx = {c: i for i, c in enumerate(categorias_ordenadas)}
         n = len(categorias_ordenadas)
-        matriz = np.zeros((n, n), dtype=int)
 
-        for cats in filas_cats:
-            for i in range(len(cats)):
-                for j in range(i + 1, len(cats)):
-                    ci, cj = cat_idx[cats[i]], cat_idx[cats[j]]
-                    matriz[ci][cj] += 1
-                    matriz[cj][ci] += 1
-
-        # Diagonal = auto-menciones (total por categoría)
-        for _, row in self.df.iterrows():
-            cats = self._extraer_categorias_por_fila(row)
-            for cat in cats:
-                if cat in cat_idx:
-                    matriz[cat_idx[cat]][cat_idx[cat]] += 1
+        # Matriz indicadora opinión × categoría: su producto consigo misma da en una sola operación
+        # los pares que aparecen juntos (fuera de la diagonal) y el total por categoría (diagonal)
+        menciones = listas_cats.explode()
+        menciones = menciones[menciones.isin(todas_cats)]
+        indicadora = (
+            pd.crosstab(menciones.index, menciones.to_numpy())
+            .reindex(columns=categorias_ordenadas, fill_value=0)
+            .to_numpy()
+        )
+        matriz = indicadora.T @ indicadora
 
         fig, ax = plt.subplots(figsize=(max(10, n * 0.9), max(8, n * 0.75)), facecolor=COLORES['fondo'])
 
@@ -420,7 +400,10 @@ class GeneradorCategorias:
         orden = df_exp.groupby('Categoria')['Calificacion'].median().sort_values(ascending=False).index
         # Limitar a top 12 para legibilidad
         orden = orden[:12]
-        df_plot = df_exp[df_exp['Categoria'].isin(orden)]
+
+        # Posiciones de cada categoría calculadas una vez, en lugar de una máscara por caja
+        posiciones = df_exp.groupby('Categoria').indices
+        calificaciones = df_exp['Calificacion'].to_numpy()
 
         fig, ax = plt.subplots(figsize=(14, 7), facecolor=COLORES['fondo'])
 
@@ -428,7 +411,7 @@ class GeneradorCategorias:
         cat_labels = get_category_labels()
 
         bp = ax.boxplot(
-            [df_plot[df_plot['Categoria'] == cat]['Calificacion'].values for cat in orden],
+            [calificaciones[posiciones[cat]] for cat in orden],
             labels=translate_categories(list(orden), cat_labels),
             patch_artist=True,
             vert=True,
@@ -476,10 +459,12 @@ class GeneradorCategorias:
         if 'FechaEstadia' not in self.df.columns:
             return
 
-        df_fechas = self.df[self.df['FechaEstadia'].notna()].copy()
-        df_fechas['FechaEstadia'] = pd.to_datetime(df_fechas['FechaEstadia'], errors='coerce')
+        # Solo se necesitan fecha y categorías: sin copiar el resto de columnas
+        columnas = [col for col in ('FechaEstadia', 'Categorias') if col in self.df.columns]
+        df_fechas = self.df.loc[self.df['FechaEstadia'].notna(), columnas]
+        df_fechas = df_fechas.assign(FechaEstadia=pd.to_datetime(df_fechas['FechaEstadia'], errors='coerce'))
         df_fechas = df_fechas.dropna(subset=['FechaEstadia'])
-        df_fechas['Mes'] = df_fechas['FechaEstadia'].dt.to_period('M')
+        df_fechas = df_fechas.assign(Mes=df_fechas['FechaEstadia'].dt.to_period('M'))
 
         if len(df_fechas) < 20:
             return
@@ -13,7 +13,7 @@ import pandas as pd
 import seaborn as sns
 
 from .i18n import get_category_labels, get_sentiment_labels, get_translator, translate_categories
-from .utils import COLORES, COLORES_SENTIMIENTO, ESTILOS, FONT_SIZES, guardar_figura
+from .utils import COLORES, COLORES_SENTIMIENTO, ESTILOS, FONT_SIZES, guardar_figura, parsear_categorias
 
 
 class GeneradorCombinados:
@@ -58,14 +58,7 @@ class GeneradorCombinados:
 
     def _extraer_categorias(self, row) -> list[str]:
         """Extrae lista de categorías de una fila."""
-        cats = row.get('Categorias', '')
-        if pd.isna(cats) or str(cats).strip() in ['', '[]', 'nan']:
-            return []
-        try:
-            cats_str = str(cats).strip('[]\'"').replace("'", '').replace('"', '')
-            return [c.strip() for c in cats_str.split(',') if c.strip()]
-        except Exception:
-            return []
+        return parsear_categorias(row.get('Categorias', ''))
 
     def _generar_sentimiento_subjetividad_categoria(self):
         """7.1 Matriz de Sentimiento vs Subjetividad coloreada por Categorías top."""
@@ -75,7 +68,7 @@ class GeneradorCombinados:
         fig, ax = plt.subplots(figsize=(12, 8), facecolor=COLORES['fondo'])
 
         # Crear tabla de contingencia
-        contingencia = pd.crosstab(self.df['Sentimiento'], self.df['Subjetividad'])
+        contingencia = self.df.groupby(['Sentimiento', 'Subjetividad'], observed=True).size().unstack(fill_value=0)
 
         t = get_translator()
         sent_labels = get_sentiment_labels()
@@ -166,32 +159,28 @@ class GeneradorCombinados:
         if 'Categorias' not in self.df.columns:
             return
 
-        # Calcular estadísticas por categoría
-        stats = {}
-        for _, row in self.df.iterrows():
-            cats = self._extraer_categorias(row)
-            sent = row.get('Sentimiento', 'Neutro')
-            for cat in cats:
-                if cat not in stats:
-                    stats[cat] = {'total': 0, 'positivo': 0, 'negativo': 0}
-                stats[cat]['total'] += 1
-                if sent == 'Positivo':
-                    stats[cat]['positivo'] += 1
-                elif sent == 'Negativo':
-                    stats[cat]['negativo'] += 1
-
-        if not stats:
+        # Una fila por mención de categoría, con la posición de su opinión como índice
+        menciones = self.df['Categorias'].map(parsear_categorias).reset_index(drop=True).explode().dropna()
+        if menciones.empty:
             return
 
+        # Categorías y sentimientos se codifican a enteros una sola vez (0 = Positivo, 1 = Negativo,
+        # -1 = otro); los conteos por categoría salen de un único bincount
+        codigos_cat, categorias = pd.factorize(menciones, sort=False)
+        if 'Sentimiento' in self.df.columns:
+            codigos_sent = pd.Categorical(self.df['Sentimiento'], categories=['Positivo', 'Negativo']).codes
+        else:
+            codigos_sent = np.full(len(self.df), -1, dtype=np.int8)
+        codigos_sent = codigos_sent[menciones.index.to_numpy()]
+
+        conteos = np.bincount(codigos_cat * 3 + codigos_sent + 1, minlength=len(categorias) * 3).reshape(-1, 3)
+        totales = conteos.sum(axis=1)
+
         # Preparar datos
-        categorias = list(stats.keys())
-        volumenes = [stats[c]['total'] for c in categorias]
-        pct_positivo = [
-            stats[c]['positivo'] / stats[c]['total'] * 100 if stats[c]['total'] > 0 else 0 for c in categorias
-        ]
-        pct_negativo = [
-            stats[c]['negativo'] / stats[c]['total'] * 100 if stats[c]['total'] > 0 else 0 for c in categorias
-        ]
+        categorias = categorias.tolist()
+        volumenes = totales.tolist()
+        pct_positivo = (conteos[:, 1] / totales * 100).tolist()
+        pct_negativo = (conteos[:, 2] / totales * 100).tolist()
 
         fig, ax = plt.subplots(figsize=(12, 8), facecolor=COLORES['fondo'])
 
@@ -260,12 +249,13 @@ class GeneradorCombinados:
         orden_sent_display = [sent_labels.get(s, s) for s in orden_sent]
         colores_sent = [COLORES_SENTIMIENTO.get(s, COLORES['neutro']) for s in orden_sent]
 
+        # Un solo groupby reparte las calificaciones por sentimiento (solo los sentimientos presentes)
+        calificaciones_por_sent = {
+            s: grupo.to_numpy() for s, grupo in df_valid.groupby('Sentimiento', observed=True)['Calificacion']
+        }
+
         parts = ax1.violinplot(
-            [
-                df_valid[df_valid['Sentimiento'] == s]['Calificacion'].values
-                for s in orden_sent
-                if s in df_valid['Sentimiento'].values
-            ],
+            [calificaciones_por_sent[s] for s in orden_sent if s in calificaciones_por_sent],
             positions=range(len(orden_sent)),
             showmeans=True,
             showmedians=True,
@@ -285,7 +275,7 @@ class GeneradorCombinados:
 
         # Panel 2: Heatmap de contingencia
         ax2 = axes[1]
-        contingencia = pd.crosstab(df_valid['Calificacion'], df_valid['Sentimiento'])
+        contingencia = df_valid.groupby(['Calificacion', 'Sentimiento'], observed=True).size().unstack(fill_value=0)
         contingencia = contingencia.reindex(columns=orden_sent, fill_value=0)
         contingencia = contingencia.rename(columns=sent_labels)
 
@@ -41,6 +41,8 @@ class GeneradorSentimientos:
             except Exception:
                 pass
 
+        self._conteo_sentimientos = None
+
     def generar_todas(self) -> list[str]:
         """Genera todas las visualizaciones de sentimientos."""
         generadas = []
@@ -79,6 +81,12 @@ class GeneradorSentimientos:
 
         return generadas
 
+    def _contar_sentimientos(self) -> pd.Series:
+        """Conteo de opiniones por sentimiento, ordenado por frecuencia (se calcula una vez por instancia)."""
+        if self._conteo_sentimientos is None:
+            self._conteo_sentimientos = self.df['Sentimiento'].value_counts()
+        return self._conteo_sentimientos
+
     def _generar_distribucion_sentimientos(self):
         """2.1 Distribución General de Sentimientos (donut chart)."""
         fig, ax = plt.subplots(figsize=(10, 8), facecolor=COLORES['fondo'])
@@ -86,7 +94,7 @@ class GeneradorSentimientos:
         t = get_translator()
         sent_labels = get_sentiment_labels()
 
-        sentimientos = self.df['Sentimiento'].value_counts()
+        sentimientos = self._contar_sentimientos()
         colores = [COLORES_SENTIMIENTO.get(s, '#666666') for s in sentimientos.index]
 
         _wedges, texts, autotexts = ax.pie(
@@ -114,12 +122,13 @@ class GeneradorSentimientos:
 
     def _generar_evolucion_temporal(self):
         """2.2 Evolución Temporal de Sentimientos."""
-        df_fechas = self.df[self.df['FechaEstadia'].notna()].copy()
-        df_fechas['FechaEstadia'] = pd.to_datetime(df_fechas['FechaEstadia'])
-        df_fechas['Mes'] = df_fechas['FechaEstadia'].dt.to_period('M')
+        # Solo se derivan las dos series necesarias; no hace falta copiar el DataFrame completo
+        con_fecha = self.df['FechaEstadia'].notna()
+        mes = pd.to_datetime(self.df.loc[con_fecha, 'FechaEstadia']).dt.to_period('M').rename('Mes')
+        sentimiento = self.df.loc[con_fecha, 'Sentimiento']
 
         # Agrupar por mes y sentimiento
-        evol = df_fechas.groupby(['Mes', 'Sentimiento']).size().unstack(fill_value=0)
+        evol = sentimiento.groupby([mes, sentimiento], observed=True).size().unstack(fill_value=0)
 
         t = get_translator()
         sent_labels = get_sentiment_labels()
@@ -132,7 +141,7 @@ class GeneradorSentimientos:
         # Gráfico de área apilada
         evol.plot.area(
             ax=ax,
-            color=[COLORES_SENTIMIENTO.get(s, '#666') for s in self.df['Sentimiento'].value_counts().index],
+            color=[COLORES_SENTIMIENTO.get(s, '#666') for s in self._contar_sentimientos().index],
             alpha=0.7,
             stacked=True,
         )
@@ -167,7 +176,7 @@ class GeneradorSentimientos:
         tabla.plot.bar(
             ax=ax,
             stacked=True,
-            color=[COLORES_SENTIMIENTO.get(s, '#666') for s in self.df['Sentimiento'].value_counts().index],
+            color=[COLORES_SENTIMIENTO.get(s, '#666') for s in self._contar_sentimientos().index],
             width=0.7,
         )
 
@@ -184,13 +193,14 @@ class GeneradorSentimientos:
 
     def _generar_wordcloud(self, sentimiento: str):
         """2.4-2.6 Nubes de Palabras por Sentimiento."""
-        df_sent = self.df[self.df['Sentimiento'] == sentimiento]
+        # Solo se filtra la columna de texto, no el DataFrame completo
+        textos_sent = self.df.loc[self.df['Sentimiento'] == sentimiento, 'TituloReview']
 
-        if len(df_sent) == 0:
+        if len(textos_sent) == 0:
             return
 
         # Concatenar todos los textos
-        texto = ' '.join(df_sent['TituloReview'].dropna().astype(str))
+        texto = ' '.join(textos_sent.dropna().astype(str))
 
         # Colormap según sentimiento
         colormap = {'Positivo': 'Greens', 'Neutro': 'Greys', 'Negativo': 'Reds'}
@@ -284,7 +294,7 @@ class GeneradorSentimientos:
             return
 
         # Crear tabla de contingencia
-        tabla = pd.crosstab(self.df['Subjetividad'], self.df['Sentimiento'])
+        tabla = self.df.groupby(['Subjetividad', 'Sentimiento'], observed=True).size().unstack(fill_value=0)
 
         fig, ax = plt.subplots(figsize=(10, 6), facecolor=COLORES['fondo'])
 
@@ -299,7 +309,7 @@ class GeneradorSentimientos:
 
         tabla.plot.bar(
             ax=ax,
-            color=[COLORES_SENTIMIENTO.get(s, '#666') for s in self.df['Sentimiento'].value_counts().index],
+            color=[COLORES_SENTIMIENTO.get(s, '#666') for s in self._contar_sentimientos().index],
             width=0.6,
         )
 
@@ -316,10 +326,10 @@ class GeneradorSentimientos:
 
     def _extraer_palabras(self, sentimiento: str) -> list[str]:
         """Extrae palabras limpias de un sentimiento específico."""
-        df_sent = self.df[self.df['Sentimiento'] == sentimiento]
+        textos_sent = self.df.loc[self.df['Sentimiento'] == sentimiento, 'TituloReview']
 
         palabras = []
-        for texto in df_sent['TituloReview'].dropna():
+        for texto in textos_sent.dropna():
             texto_limpio = str(texto).lower()
             # Extraer solo palabras alfanuméricas de más de 3 caracteres
             tokens = [
@@ -177,8 +177,10 @@ class GeneradorSubjetividad:
         t = get_translator()
         subj_labels = get_subjectivity_labels()
 
-        df_temp = self.df.copy()
-        df_temp['FechaEstadia'] = pd.to_datetime(df_temp['FechaEstadia'], errors='coerce')
+        # Solo se necesitan dos columnas: evita copiar el dataset completo (textos incluidos)
+        df_temp = self.df[['FechaEstadia', 'Subjetividad']].assign(
+            FechaEstadia=pd.to_datetime(self.df['FechaEstadia'], errors='coerce')
+        )
         df_temp = df_temp.dropna(subset=['FechaEstadia', 'Subjetividad'])
 
         if len(df_temp) < 30:
@@ -186,7 +188,7 @@ class GeneradorSubjetividad:
 
         df_temp['Periodo'] = df_temp['FechaEstadia'].dt.to_period('M')
 
-        ct = pd.crosstab(df_temp['Periodo'], df_temp['Subjetividad'])
+        ct = df_temp.groupby(['Periodo', 'Subjetividad'], observed=True).size().unstack(fill_value=0)
         # Normalise to percentages
         ct_pct = ct.div(ct.sum(axis=1), axis=0) * 100
 
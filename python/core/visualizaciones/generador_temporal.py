@@ -11,7 +11,7 @@ import pandas as pd
 import seaborn as sns
 
 from .i18n import get_category_labels, get_sentiment_labels, get_translator
-from .utils import COLORES, COLORES_SENTIMIENTO, ESTILOS, FONT_SIZES, guardar_figura
+from .utils import COLORES, COLORES_SENTIMIENTO, ESTILOS, FONT_SIZES, guardar_figura, parsear_categorias
 
 
 class GeneradorTemporal:
@@ -47,13 +47,13 @@ class GeneradorTemporal:
 
     def _generar_volumen_temporal(self):
         """5.1 Volumen de Opiniones en el Tiempo."""
-        df_fechas = self.df[self.df['FechaEstadia'].notna()].copy()
+        # Solo se necesita la fecha: sin copiar el resto de columnas
+        df_fechas = self.df.loc[self.df['FechaEstadia'].notna(), ['FechaEstadia']]
 
         if len(df_fechas) == 0:
             return
 
-        df_fechas['FechaEstadia'] = pd.to_datetime(df_fechas['FechaEstadia'])
-        df_fechas['Mes'] = df_fechas['FechaEstadia'].dt.to_period('M')
+        df_fechas = df_fechas.assign(Mes=pd.to_datetime(df_fechas['FechaEstadia']).dt.to_period('M'))
 
         volumen = df_fechas.groupby('Mes').size()
 
@@ -75,15 +75,14 @@ class GeneradorTemporal:
 
     def _generar_evolucion_sentimientos(self):
         """5.2 Evolución Temporal de Sentimientos."""
-        df_fechas = self.df[self.df['FechaEstadia'].notna()].copy()
+        df_fechas = self.df.loc[self.df['FechaEstadia'].notna(), ['FechaEstadia', 'Sentimiento']]
 
         if len(df_fechas) == 0:
             return
 
-        df_fechas['FechaEstadia'] = pd.to_datetime(df_fechas['FechaEstadia'])
-        df_fechas['Mes'] = df_fechas['FechaEstadia'].dt.to_period('M')
+        df_fechas = df_fechas.assign(Mes=pd.to_datetime(df_fechas['FechaEstadia']).dt.to_period('M'))
 
-        evol = df_fechas.groupby(['Mes', 'Sentimiento']).size().unstack(fill_value=0)
+        evol = df_fechas.groupby(['Mes', 'Sentimiento'], observed=True).size().unstack(fill_value=0)
 
         fig, ax = plt.subplots(figsize=(14, 6), facecolor=COLORES['fondo'])
 
@@ -114,14 +113,7 @@ class GeneradorTemporal:
 
     def _extraer_categorias(self, row) -> list[str]:
         """Extrae lista de categorías de una fila."""
-        cats = row.get('Categorias', '')
-        if pd.isna(cats) or str(cats).strip() in ['', '[]', 'nan']:
-            return []
-        try:
-            cats_str = str(cats).strip('[]\'"').replace("'", '').replace('"', '')
-            return [c.strip() for c in cats_str.split(',') if c.strip()]
-        except Exception:
-            return []
+        return parsear_categorias(row.get('Categorias', ''))
 
     def _generar_tendencia_calificacion(self):
         """5.3 Tendencia de Calificación en el Tiempo.
@@ -132,10 +124,10 @@ class GeneradorTemporal:
         if 'Calificacion' not in self.df.columns:
             return
 
-        df_fechas = self.df[self.df['FechaEstadia'].notna()].copy()
-        df_fechas['FechaEstadia'] = pd.to_datetime(df_fechas['FechaEstadia'], errors='coerce')
+        df_fechas = self.df.loc[self.df['FechaEstadia'].notna(), ['FechaEstadia', 'Calificacion']]
+        df_fechas = df_fechas.assign(FechaEstadia=pd.to_datetime(df_fechas['FechaEstadia'], errors='coerce'))
         df_fechas = df_fechas.dropna(subset=['FechaEstadia', 'Calificacion'])
-        df_fechas['Mes'] = df_fechas['FechaEstadia'].dt.to_period('M')
+        df_fechas = df_fechas.assign(Mes=df_fechas['FechaEstadia'].dt.to_period('M'))
 
         if len(df_fechas) < 20:
             return
@@ -222,10 +214,10 @@ class GeneradorTemporal:
         if 'FechaEstadia' not in self.df.columns or 'Categorias' not in self.df.columns:
             return
 
-        df_fechas = self.df[self.df['FechaEstadia'].notna()].copy()
-        df_fechas['FechaEstadia'] = pd.to_datetime(df_fechas['FechaEstadia'], errors='coerce')
+        df_fechas = self.df.loc[self.df['FechaEstadia'].notna(), ['FechaEstadia', 'Categorias']]
+        df_fechas = df_fechas.assign(FechaEstadia=pd.to_datetime(df_fechas['FechaEstadia'], errors='coerce'))
         df_fechas = df_fechas.dropna(subset=['FechaEstadia'])
-        df_fechas['MesNum'] = df_fechas['FechaEstadia'].dt.month
+        df_fechas = df_fechas.assign(MesNum=df_fechas['FechaEstadia'].dt.month)
 
         if len(df_fechas) < 50:
             return
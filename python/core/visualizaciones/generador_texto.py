@@ -25,6 +25,12 @@ from wordcloud import WordCloud
 from .i18n import get_translator
 from .utils import COLORES, ESTILOS, FONT_SIZES, guardar_figura
 
+# Patrones de limpieza compilados una sola vez (se aplican a cada opinión)
+_RE_URLS = re.compile(r'http\S+|www\.\S+')
+_RE_CARACTERES_ESPECIALES = re.compile(r'[^\w\sáéíóúñü]')
+_RE_NUMEROS = re.compile(r'\d+')
+_RE_ESPACIOS = re.compile(r'\s+')
+
 
 class GeneradorTexto:
     """Genera visualizaciones gráficas de análisis de texto."""
@@ -157,13 +163,13 @@ class GeneradorTexto:
             return ''
         texto = str(texto).lower()
         # Eliminar URLs
-        texto = re.sub(r'http\S+|www\.\S+', '', texto)
+        texto = _RE_URLS.sub('', texto)
         # Eliminar caracteres especiales pero mantener acentos
-        texto = re.sub(r'[^\w\sáéíóúñü]', ' ', texto)
+        texto = _RE_CARACTERES_ESPECIALES.sub(' ', texto)
         # Eliminar números
-        texto = re.sub(r'\d+', '', texto)
+        texto = _RE_NUMEROS.sub('', texto)
         # Eliminar espacios múltiples
-        texto = re.sub(r'\s+', ' ', texto).strip()
+        texto = _RE_ESPACIOS.sub(' ', texto).strip()
         return texto
 
     def _obtener_palabras(self, texto: str) -> list[str]:
@@ -216,6 +222,8 @@ class GeneradorTexto:
         columna = 'TituloReview' if 'TituloReview' in self.df.columns else 'Review'
 
         longitudes = self.df[columna].dropna().apply(lambda x: len(str(x).split()))
+        media = longitudes.mean()
+        mediana = longitudes.median()
 
         fig, axes = plt.subplots(1, 2, figsize=(14, 6), facecolor=COLORES['fondo'])
 
@@ -225,18 +233,18 @@ class GeneradorTexto:
         ax1 = axes[0]
         ax1.hist(longitudes, bins=30, color=COLORES['primario'], alpha=0.7, edgecolor=COLORES['borde_separador'])
         ax1.axvline(
-            longitudes.mean(),
+            media,
             color=COLORES['negativo'],
             linestyle='--',
             linewidth=2,
-            label=t('media_valor', value=f'{longitudes.mean():.1f}'),
+            label=t('media_valor', value=f'{media:.1f}'),
         )
         ax1.axvline(
-            longitudes.median(),
+            mediana,
             color=COLORES['positivo'],
             linestyle='--',
             linewidth=2,
-            label=t('mediana_valor', value=f'{longitudes.median():.1f}'),
+            label=t('mediana_valor', value=f'{mediana:.1f}'),
         )
         ax1.set_xlabel(t('cantidad_palabras'), **ESTILOS['etiquetas'])
         ax1.set_ylabel(t('frecuencia'), **ESTILOS['etiquetas'])
@@ -52,35 +52,37 @@ class GeneradorTopicos:
             return f'{translated_cat} | {parts[1]}'
         return label
 
-    def _extraer_subtopicos_con_categoria(self):
-        """Extrae subtópicos con su categoría padre."""
-        subtopicos_data = []
+    def _iterar_subtopicos_con_categoria(self):
+        """
+        Recorre los subtópicos con su categoría padre y el sentimiento de la reseña.
 
-        for _, row in self.df.iterrows():
-            topico_str = row.get('Topico', '{}')
-            sentimiento = row.get('Sentimiento', 'Neutro')
+        Genera tuplas ``(categoria, subtopico, sentimiento)`` bajo demanda, de modo que
+        cada gráfico agrega directamente sobre el flujo sin materializar un diccionario
+        por mención.
+        """
+        n = len(self.df)
+        topicos = self.df['Topico'] if 'Topico' in self.df.columns else ['{}'] * n
+        sentimientos = self.df['Sentimiento'] if 'Sentimiento' in self.df.columns else ['Neutro'] * n
 
+        for topico_str, sentimiento in zip(topicos, sentimientos):
             try:
                 if topico_str and str(topico_str).strip() not in ['{}', 'nan', 'None', '']:
                     topico_dict = ast.literal_eval(str(topico_str))
                     for categoria, subtopico in topico_dict.items():
-                        subtopicos_data.append(
-                            {'categoria': categoria, 'subtopico': subtopico, 'sentimiento': sentimiento}
-                        )
+                        yield categoria, subtopico, sentimiento
             except Exception:
                 continue
 
-        return subtopicos_data
-
     def _generar_top_subtopicos(self):
         """4.1 Top 10 Sub-tópicos Más Mencionados."""
-        subtopicos_data = self._extraer_subtopicos_con_categoria()
+        # Contar menciones directamente sobre el flujo de subtópicos
+        contador = Counter(
+            (categoria, subtopico) for categoria, subtopico, _ in self._iterar_subtopicos_con_categoria()
+        )
 
-        if not subtopicos_data:
+        if not contador:
             return
 
-        # Contar menciones
-        contador = Counter([(d['categoria'], d['subtopico']) for d in subtopicos_data])
         top_10 = contador.most_common(10)
 
         fig, ax = plt.subplots(figsize=(12, 8), facecolor=COLORES['fondo'])
@@ -110,19 +112,14 @@ class GeneradorTopicos:
 
     def _generar_subtopicos_problematicos(self):
         """4.2 Top 10 Sub-tópicos Problemáticos."""
-        subtopicos_data = self._extraer_subtopicos_con_categoria()
-
-        if not subtopicos_data:
-            return
-
         # Agrupar por subtópico y calcular % negativo
         from collections import defaultdict
 
         subtopico_sentimientos = defaultdict(lambda: {'Positivo': 0, 'Neutro': 0, 'Negativo': 0, 'total': 0})
 
-        for data in subtopicos_data:
-            key = f'{data["categoria"]} | {data["subtopico"]}'
-            subtopico_sentimientos[key][data['sentimiento']] += 1
+        for categoria, subtopico, sentimiento in self._iterar_subtopicos_con_categoria():
+            key = f'{categoria} | {subtopico}'
+            subtopico_sentimientos[key][sentimiento] += 1
             subtopico_sentimientos[key]['total'] += 1
 
         cat_labels = get_category_labels()
@@ -180,18 +177,13 @@ class GeneradorTopicos:
         y su distribución de sentimiento (columnas), facilitando la
         identificación rápida de temas conflictivos vs satisfactorios.
         """
-        subtopicos_data = self._extraer_subtopicos_con_categoria()
-
-        if not subtopicos_data:
-            return
-
         from collections import defaultdict
 
         # Agrupar por subtópico
         subtopico_sent = defaultdict(lambda: {'Positivo': 0, 'Neutro': 0, 'Negativo': 0})
-        for data in subtopicos_data:
-            label = f'{data["categoria"]} | {data["subtopico"]}'
-            subtopico_sent[label][data['sentimiento']] += 1
+        for categoria, subtopico, sentimiento in self._iterar_subtopicos_con_categoria():
+            label = f'{categoria} | {subtopico}'
+            subtopico_sent[label][sentimiento] += 1
 
         cat_labels = get_category_labels()
 
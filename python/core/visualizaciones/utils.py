@@ -1,17 +1,14 @@
 """
 Utilidades para Visualizaciones
 ================================
-Constantes, colores, estilos y funciones de exportación.
+Constantes, colores, estilos, funciones de exportación y parseo de la columna 'Categorias'.
 Soporta temas light y dark para generación dual de visualizaciones.
 """
 
-import warnings
 from pathlib import Path
 
 import matplotlib.pyplot as plt
-
-warnings.filterwarnings('ignore')
-
+import pandas as pd
 
 # ========== TEMA ACTIVO ==========
 # El tema activo controla los colores de fondo, texto y exportación.
@@ -248,3 +245,15 @@ def truncar_texto(texto: str, max_len: int = 30) -> str:
     if len(texto) <= max_len:
         return texto
     return texto[: max_len - 3] + '...'
+
+
+# Tabla para eliminar comillas simples y dobles en una sola pasada (str.translate)
+_SIN_COMILLAS = str.maketrans('', '', '\'"')
+
+
+def parsear_categorias(cats) -> list[str]:
+    """Convierte un valor de la columna 'Categorias' (p. ej. "['Gastronomía', 'Transporte']") en lista."""
+    if pd.isna(cats) or str(cats).strip() in ['', '[]', 'nan']:
+        return []
+    cats_str = str(cats).strip('[]\'"').translate(_SIN_COMILLAS)
+    return [c.strip() for c in cats_str.split(',') if c.strip()]
@@ -36,7 +36,8 @@ class ValidadorVisualizaciones:
         if 'Topico' not in self.df.columns:
             return False
 
-        topicos_validos = self.df['Topico'].apply(lambda x: x and str(x).strip() not in ['{}', 'nan', 'None', '']).sum()
+        topicos = self.df['Topico'].fillna('').astype(str).str.strip()
+        topicos_validos = (~topicos.isin(['{}', 'nan', 'None', ''])).sum()
 
         return topicos_validos / len(self.df) > 0.3  # >30% con tópicos
 
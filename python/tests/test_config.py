@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pandas as pd
+
 from config.config import ConfigDataset, ConfigLLM
 
 
@@ -45,6 +47,18 @@ class TestConfigDataset:
         assert isinstance(ConfigDataset.EMBEDDINGS_MODEL_ID, str)
         assert len(ConfigDataset.EMBEDDINGS_MODEL_ID) > 0
 
+    def test_categorical_dtypes_cover_label_columns(self):
+        dtypes = ConfigDataset.get_categorical_dtypes()
+        assert dtypes == {'Sentimiento': 'category', 'Subjetividad': 'category'}
+
+    def test_get_missing_columns_preserves_requested_order(self):
+        df = pd.DataFrame(columns=['TituloReview', 'Sentimiento'])
+        assert ConfigDataset.get_missing_columns(df, ['Subjetividad', 'TituloReview', 'Calificacion']) == [
+            'Subjetividad',
+            'Calificacion',
+        ]
+        assert ConfigDataset.get_missing_columns(df, ['Sentimiento']) == []
+
 
 class TestConfigLLM:
     """Tests for ConfigLLM validation."""
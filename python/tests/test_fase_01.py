@@ -94,3 +94,20 @@ class TestProcesadorBasico:
 
         mtime2 = proc.dataset_path.stat().st_mtime
         assert mtime1 == mtime2, 'File mtime should not change when already processed'
+
+    def test_procesar_consolidado_matches_row_helper(self, tmp_path):
+        """The vectorized TituloReview in procesar() should equal crear_texto_consolidado row by row."""
+        df = pd.DataFrame(
+            {
+                'Titulo': ['Great hotel', '  Sin Titulo ', None, 'Done.', 'NONE'],
+                'Review': ['Clean room', 'Loud.', 'Only review', None, ' ok  '],
+            }
+        )
+        input_csv = tmp_path / 'input.csv'
+        df.to_csv(input_csv, index=False)
+
+        proc = ProcesadorBasico(input_path=str(input_csv))
+        proc.procesar(forzar=True)
+
+        esperado = df.fillna('').apply(proc.crear_texto_consolidado, axis=1)
+        assert proc.df['TituloReview'].tolist() == esperado.tolist()
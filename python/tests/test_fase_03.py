@@ -0,0 +1,19 @@
+"""Tests for fase_03_analisis_sentimientos.py — AnalizadorSentimientos."""
+
+from core.fase_03_analisis_sentimientos import AnalizadorSentimientos
+
+
+class TestAnalizadorSentimientos:
+    """Tests for the star-to-sentiment mapping."""
+
+    def test_estrellas_a_sentimiento_matches_label_mapping(self):
+        """The vectorized mapping should agree with MAPEO_ETIQUETAS for every star value."""
+        labels = list(AnalizadorSentimientos.MAPEO_ESTRELLAS)
+        estrellas = [AnalizadorSentimientos.MAPEO_ESTRELLAS[label] for label in labels]
+        result = AnalizadorSentimientos.estrellas_a_sentimiento(estrellas)
+        assert list(result) == [AnalizadorSentimientos.MAPEO_ETIQUETAS[label] for label in labels]
+
+    def test_estrellas_a_sentimiento_missing_values_are_neutral(self):
+        """Missing or out-of-range ratings should map to 'Neutro'."""
+        result = AnalizadorSentimientos.estrellas_a_sentimiento([None, 0, 9])
+        assert list(result) == ['Neutro', 'Neutro', 'Neutro']
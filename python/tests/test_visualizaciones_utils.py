@@ -0,0 +1,20 @@
+"""Tests for visualizaciones/utils.py — shared parsing helpers."""
+
+import ast
+
+import pandas as pd
+
+from core.visualizaciones.utils import parsear_categorias
+
+
+class TestParsearCategorias:
+    """Tests for the 'Categorias' column parser shared by the generators."""
+
+    def test_matches_literal_eval_on_phase_05_output(self):
+        """Fase 05 writes str(list); the parser should agree with literal_eval on that format."""
+        for cats in [['Transporte', 'Personal y servicio'], ['Gastronomía'], ['Fauna y vida animal', 'Naturaleza']]:
+            assert parsear_categorias(str(cats)) == ast.literal_eval(str(cats))
+
+    def test_empty_and_missing_values_return_empty_list(self):
+        for valor in [None, float('nan'), pd.NA, '', '[]', 'nan', '  ']:
+            assert parsear_categorias(valor) == []
@@ -6,13 +6,14 @@ INSTRUCTIONS:
 1. Create a Hugging Face account at https://huggingface.co
 2. Go to Settings > Access Tokens > Create new token (with Write permission)
 3. Run: huggingface-cli login (paste your token when prompted)
-4. Then run this script
+4. Then run this script (add --yes to skip the confirmation prompt in unattended runs)
 
 This will upload:
 - Subjectivity model → your-username/tourism-subjectivity-bert
 - Categories model → your-username/tourism-categories-bert
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -194,7 +195,20 @@ def upload_model(local_path: Path, repo_id: str, model_type: str):
     return True
 
 
+def parse_args():
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description="Upload custom models to Hugging Face Hub")
+    parser.add_argument(
+        "-y", "--yes",
+        action="store_true",
+        help="Don't ask for confirmation when the logged-in user differs from HF_USERNAME",
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
+
     print("=" * 60)
     print("  Hugging Face Model Uploader")
     print("  AI Tourism Opinion Analyzer")
@@ -215,9 +229,10 @@ def main():
     # Verify username matches
     if username.lower() != HF_USERNAME.lower():
         print(f"\n⚠️ Warning: You're logged in as '{username}' but HF_USERNAME is '{HF_USERNAME}'")
-        response = input("   Continue anyway? (y/n): ")
-        if response.lower() != 'y':
-            sys.exit(0)
+        if not args.yes:
+            response = input("   Continue anyway? (y/n): ")
+            if response.lower() != 'y':
+                sys.exit(0)
     
     print(f"\n📁 Looking for models in: {BASE_DIR}")
     